@@ -0,0 +1,5 @@
+"""Benchmarks for the dashboard data layer and pages.
+
+``python -m benchmarks.run`` times each stage; ``python -m benchmarks.load``
+runs many concurrent sessions against a stand-in data server.
+"""
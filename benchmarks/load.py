@@ -0,0 +1,250 @@
+"""Load test: N concurrent dashboard sessions against a stand-in data server.
+
+    python -m benchmarks.load                                   # 50 sessions, 1000 rows
+    python -m benchmarks.load --sessions 200 --rows 10000 --latency 0.2
+    python -m benchmarks.load --workbook data/Dashboard_data.xlsx --json load.json
+
+A local HTTP server stands in for GitHub: it serves the workbook (synthetic
+unless ``--workbook`` is given) with Last-Modified validators, answers after
+``--latency`` seconds, and counts the requests it gets. Streamlit runs each
+session's script in a thread of one server process, sharing the imported
+modules, so a session here is a thread doing what a page rerun does with the
+data: read the published version from the store, look up a project, count
+and apply facet filters. (AppTest can't stand in for sessions: it drives a
+process-wide runtime, one app at a time.)
+
+Phases:
+
+  cold        first run of every session, all started at once on a cold process
+  rerun       ``--reruns`` warm reruns per session, each on a random project
+  revalidate  the workbook changes; then every session calls the loader with an expired TTL at once
+  refresh     ``--reruns`` reruns per session while the store publishes the change
+
+Each phase reports latency percentiles, the requests the data server
+answered and how many loads ran vs. waited on one already in flight.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.synthetic import write_workbook
+
+WORKBOOK = "Dashboard_data.xlsx"
+PERCENTILES = [50, 90, 99]
+
+
+class DataServer:
+    """Threaded static file server over ``directory`` that counts responses by request and status."""
+
+    def __init__(self, directory, latency=0.0):
+        self.counts = Counter()
+        lock = threading.Lock()
+        counts = self.counts
+
+        class Handler(SimpleHTTPRequestHandler):
+            def do_GET(self):
+                time.sleep(latency)
+                super().do_GET()
+
+            def send_response(self, code, message=None):
+                with lock:
+                    counts[f"{self.command} {self.path} {code}"] += 1
+                super().send_response(code, message)
+
+            def log_message(self, *args):
+                pass
+
+        self._lock = lock
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), partial(Handler, directory=str(directory)))
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_port}/"
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, name="data-server", daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def take(self):
+        """Requests answered since the last call."""
+        with self._lock:
+            counts = dict(self.counts)
+            self.counts.clear()
+        return counts
+
+
+def run_sessions(sessions, fn, calls=1):
+    """Start ``sessions`` threads together, each calling ``fn(session)`` ``calls`` times.
+
+    Returns every call's latency in milliseconds and the wall time in seconds;
+    the first exception a session raised is re-raised.
+    """
+    barrier = threading.Barrier(sessions)
+
+    def session(i):
+        barrier.wait()
+        samples = []
+        for _ in range(calls):
+            started = time.perf_counter()
+            fn(i)
+            samples.append((time.perf_counter() - started) * 1000)
+        return samples
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        futures = [pool.submit(session, i) for i in range(sessions)]
+        samples = [ms for future in futures for ms in future.result()]
+    return samples, time.perf_counter() - started
+
+
+def summarize(samples, wall, requests, flights):
+    """Latency percentiles (ms), throughput and request/load counts of one phase."""
+    runs, shared = flights
+    return {
+        "calls": len(samples),
+        **{f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(samples, PERCENTILES))},
+        "max": max(samples),
+        "per_s": len(samples) / wall,
+        "loads": runs,
+        "waited": shared,
+        "requests": requests,
+    }
+
+
+class Harness:
+    """The dashboard data layer of one process, pointed at a ``DataServer``."""
+
+    def __init__(self, server, seed=0):
+        # Imported here so the environment set up by main() applies.
+        from dashboard import loader, store
+        from dashboard.facets import facet_index
+        from dashboard.views import load_dataset
+
+        self.loader, self.store = loader, store
+        self.facet_index, self.load_dataset = facet_index, load_dataset
+        self.server = server
+        self.source = server.url + WORKBOOK
+        loader.DATA_SOURCE = self.source
+        self.rng = random.Random(seed)
+        self._flights = (0, 0)
+
+    def reset(self):
+        """Back to a cold process: no stores, nothing cached."""
+        for data_store in self.store._stores.values():
+            data_store.stop()
+        self.store._stores.clear()
+        self.loader.clear_cache()
+        self.server.take()
+
+    def rerun(self, session):
+        """The data side of one page rerun."""
+        dataset, index = self.load_dataset()
+        facets = self.facet_index(dataset)
+        selected = {"Region": [self.rng.choice(facets.options["Region"])]}
+        facets.counts(selected)
+        facets.matching(selected)
+        index.row(self.rng.choice(index.projects))
+
+    def revalidate(self, session):
+        self.loader.load_entry(self.source, ttl=0)
+
+    def phase(self, sessions, fn, calls=1, background=None):
+        """Run the sessions (with ``background()`` running alongside) and summarize them."""
+        if background is not None:
+            background = threading.Thread(target=background, name="background")
+            background.start()
+        samples, wall = run_sessions(sessions, fn, calls)
+        if background is not None:
+            background.join()
+        flights = self.loader._flights
+        runs, shared = flights.runs - self._flights[0], flights.shared - self._flights[1]
+        self._flights = (flights.runs, flights.shared)
+        return summarize(samples, wall, self.server.take(), (runs, shared))
+
+
+def change_workbook(path, args):
+    """Give the served workbook a later Last-Modified and, if it is synthetic, other values."""
+    if not args.workbook:
+        write_workbook(path, args.rows, args.text_length, seed=1)
+    stamp = path.stat().st_mtime + 60
+    os.utime(path, (stamp, stamp))
+
+
+def run(args, workdir):
+    path = Path(workdir) / WORKBOOK
+    if args.workbook:
+        shutil.copyfile(args.workbook, path)
+    else:
+        write_workbook(path, args.rows, args.text_length)
+    server = DataServer(workdir, args.latency).start()
+    harness = Harness(server)
+    phases = {}
+    try:
+        harness.reset()
+        phases["cold"] = harness.phase(args.sessions, harness.rerun)
+        phases["rerun"] = harness.phase(args.sessions, harness.rerun, args.reruns)
+
+        change_workbook(path, args)
+        phases["revalidate"] = harness.phase(args.sessions, harness.revalidate)
+
+        refresh = harness.store.get_store(harness.source).refresh
+        phases["refresh"] = harness.phase(args.sessions, harness.rerun, args.reruns, background=refresh)
+    finally:
+        harness.reset()
+        server.stop()
+    return phases
+
+
+def print_table(phases):
+    names = list(phases)
+    metrics = [f"p{p}" for p in PERCENTILES] + ["max", "per_s", "loads", "waited"]
+    width = max(map(len, metrics + ["requests"])) + 2
+    print("metric".ljust(width) + "".join(f"{name:>12}" for name in names) + "   (ms unless noted)")
+    for metric in ["calls"] + metrics:
+        print(metric.ljust(width) + "".join(f"{phases[name][metric]:>12,.1f}" for name in names))
+    print()
+    for name in names:
+        for request, count in sorted(phases[name]["requests"].items()):
+            print(f"{name:<12}{count:>6}  {request}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the dashboard data layer with concurrent sessions.")
+    parser.add_argument("--sessions", type=int, default=50, help="concurrent sessions")
+    parser.add_argument("--reruns", type=int, default=20, help="warm reruns per session")
+    parser.add_argument("--rows", type=int, default=1000, help="rows of the synthetic workbook")
+    parser.add_argument("--text-length", type=int, default=200, help="characters per long text cell")
+    parser.add_argument("--workbook", help="serve this workbook instead of a synthetic one")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds the data server waits per request")
+    parser.add_argument("--json", help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # Keep this run's history and shell summary out of data/.
+        os.environ["DASHBOARD_HISTORY_DIR"] = ""
+        os.environ["DASHBOARD_SHELL_CACHE"] = str(Path(workdir) / "shell.json")
+        print(f"{args.sessions} sessions ...", file=sys.stderr)
+        phases = run(args, workdir)
+
+    print_table(phases)
+    if args.json:
+        Path(args.json).write_text(json.dumps({"args": vars(args), "phases": phases}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
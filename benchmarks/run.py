@@ -0,0 +1,195 @@
+"""Benchmark the data layer and both pages against synthetic workbooks.
+
+    python -m benchmarks.run                                  # 10, 100, 1000, 10000 rows
+    python -m benchmarks.run --sizes 100000 --text-length 800
+    python -m benchmarks.run --json bench.json --compare baseline.json
+
+Stages (median milliseconds over ``--repeat`` runs):
+
+  load            parse the XLSX and normalize it (what a cold load pays)
+  load:openpyxl   the same through pd.read_excel instead of the streaming reader
+  normalize       schema + type normalization of an already parsed frame
+  snapshot_build  compile the Parquet snapshot
+  snapshot_load   read the snapshot back
+  index           project index incl. Region/Type sidebar counts
+  select          one project lookup (averaged over many lookups)
+  portfolio       portfolio summary aggregates
+  render:<page>   one warm rerun of the page with a project selected
+
+Rows per second through ``load``, the in-memory size of the compacted frame
+and the peak RSS a fresh process adds while parsing the workbook with each
+engine are reported alongside.
+"""
+import argparse
+import io
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.synthetic import write_workbook
+from dashboard import history, loader, shell
+from dashboard.compact import compact
+from dashboard.index import ProjectIndex
+from dashboard.portfolio import PortfolioSummary
+from dashboard.snapshot import build_snapshot, read_snapshot, snapshot_location, source_digest
+from dashboard.workbook import clean_frame, read_workbook
+
+ROOT = Path(__file__).resolve().parent.parent
+PAGES = ["streamlit_app.py", "pm_dashboard.py"]
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+ENGINES = ["stream", "openpyxl"]
+# Peak RSS growth while parsing, measured past the imports in a fresh interpreter.
+PEAK_RSS_SCRIPT = """
+import sys
+from dashboard.timing import peak_rss_mb
+from dashboard.workbook import read_workbook
+before = peak_rss_mb()
+read_workbook(sys.argv[1], engine=sys.argv[2])
+print(peak_rss_mb() - before)
+"""
+
+
+def measure(fn, repeat):
+    """Median wall time of ``fn()`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def parse_memory(path):
+    """{engine: MiB} of peak RSS added by parsing ``path`` once in a fresh process."""
+    return {
+        engine: float(subprocess.run([sys.executable, "-c", PEAK_RSS_SCRIPT, str(path), engine], cwd=ROOT,
+                                     check=True, capture_output=True, text=True).stdout)
+        for engine in ENGINES
+    }
+
+
+def render_page(page, source, project, repeat):
+    """Median warm rerun of ``page`` with ``project`` selected."""
+    from streamlit.testing.v1 import AppTest
+
+    loader.DATA_SOURCE = str(source)
+    at = AppTest.from_file(str(ROOT / page), default_timeout=600).run()
+    at.sidebar.selectbox[0].select(project).run()
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].message}")
+    return measure(at.run, repeat)
+
+
+def bench_size(rows, workdir, text_length, repeat, pages, memory):
+    path = Path(workdir) / f"synthetic_{rows}.xlsx"
+    write_workbook(path, rows, text_length)
+    data = path.read_bytes()
+    raw = pd.read_excel(io.BytesIO(data))
+
+    results = {
+        "load": measure(lambda: read_workbook(io.BytesIO(data), engine="stream"), repeat),
+        "load:openpyxl": measure(lambda: read_workbook(io.BytesIO(data), engine="openpyxl"), repeat),
+        "normalize": measure(lambda: clean_frame(raw.copy()), repeat),
+        "snapshot_build": measure(lambda: build_snapshot(path), repeat),
+    }
+    digest = source_digest(data)
+    snapshot = snapshot_location(path)
+    results["snapshot_load"] = measure(lambda: read_snapshot(snapshot, digest), repeat)
+
+    # Lookups and aggregates run on the compacted frame the loader hands out.
+    df = compact(read_workbook(io.BytesIO(data)))
+    results["index"] = measure(lambda: ProjectIndex(df), repeat)
+    index = ProjectIndex(df)
+    lookups = index.projects[:: max(1, len(index.projects) // 1000)]
+    results["select"] = measure(lambda: [index.row(p) for p in lookups], repeat) / len(lookups)
+    results["portfolio"] = measure(lambda: PortfolioSummary(df), repeat)
+
+    for page in pages:
+        results[f"render:{page}"] = render_page(page, path, index.projects[len(index.projects) // 2], repeat)
+
+    memory[str(rows)] = {
+        "rows_per_s": round(rows / results["load"] * 1000),
+        "frame_mb": df.memory_usage(deep=True, index=False).sum() / 2**20,
+        **{f"peak_rss_mb:{engine}": mb for engine, mb in parse_memory(path).items()},
+    }
+    return results
+
+
+def print_table(report):
+    sizes = list(report["results"])
+    stages = list(report["results"][sizes[0]])
+    metrics = list(report["memory"][sizes[0]])
+    width = max(len(s) for s in stages + metrics) + 2
+    print("stage".ljust(width) + "".join(f"{s:>12}" for s in sizes) + "   (ms, median)")
+    for stage in stages:
+        print(stage.ljust(width) + "".join(f"{report['results'][s][stage]:>12.3f}" for s in sizes))
+    print()
+    for metric in metrics:
+        print(metric.ljust(width) + "".join(f"{report['memory'][s][metric]:>12,.1f}" for s in sizes))
+
+
+def compare(report, baseline, threshold):
+    """Stages slower than ``threshold`` x baseline, as printable lines."""
+    regressions = []
+    for size, stages in report["results"].items():
+        for stage, ms in stages.items():
+            before = baseline["results"].get(size, {}).get(stage)
+            if before and ms > before * threshold:
+                regressions.append(f"{size} rows {stage}: {before:.3f} -> {ms:.3f} ms ({ms / before:.2f}x)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dashboard load, normalization, lookup and render.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="rows per workbook")
+    parser.add_argument("--text-length", type=int, default=200, help="characters per long text cell")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per stage (median is reported)")
+    parser.add_argument("--pages", nargs="*", default=PAGES, help="page scripts to render (none to skip)")
+    parser.add_argument("--json", help="write the report as JSON")
+    parser.add_argument("--compare", help="baseline JSON report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.25, help="regression ratio (default 1.25)")
+    args = parser.parse_args(argv)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "text_length": args.text_length,
+            "repeat": args.repeat,
+        },
+        "results": {},
+        "memory": {},
+    }
+    # Per-sample timing lines would be timed along with the stages.
+    logging.getLogger("dashboard").setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as workdir:
+        # Rendered pages publish through the data store: keep their history and shell summary out of data/.
+        history.HISTORY_DIR = ""
+        shell.SHELL_CACHE = str(Path(workdir) / "shell.json")
+        for rows in args.sizes:
+            print(f"benchmarking {rows} rows ...", file=sys.stderr)
+            report["results"][str(rows)] = bench_size(
+                rows, workdir, args.text_length, args.repeat, args.pages, report["memory"])
+
+    print_table(report)
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+    if args.compare:
+        regressions = compare(report, json.loads(Path(args.compare).read_text()), args.threshold)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Synthetic workbooks with the Dashboard_data.xlsx column layout.
+
+    python -m benchmarks.synthetic 10000 -o synthetic_10000.xlsx --text-length 400
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Same headers, same order as data/Dashboard_data.xlsx.
+COLUMNS = [
+    "SN", "Project", "search_db", "Project1", "Region", "Type", "Total PO Amt", "Billed Till Date",
+    "Accrual", "Total Revenue", "Open AR", "Open Billing", "Billed YTD_FY25-26", "Current Month Billing",
+    "Project Duration", "Billed", "Billing Milestone", "Project Dates", "Resource",
+    "Milestone billing amount", "Scope", "Overall Progress", "Weekly Plan", "Technology / tools",
+    "Challenges / Risks", "Update Date", "Profit_YTD MIS", "Profit_FY24-25_MIS", "search_db1",
+    "Project Manager / Lead",
+]
+
+REGIONS = ["North", "South", "East", "West"]
+TYPES = ["Application Maintenance", "Software Development", "Smart City", "EMS", "FMS", "CRP"]
+WORDS = (
+    "billing payment pending approval deployment migration security audit database upgrade "
+    "resource onboarding module testing release integration support report invoice milestone"
+).split()
+
+
+def _sentences(rng, rows, length):
+    """``rows`` text cells of roughly ``length`` characters, sentences split by '|'."""
+    out = []
+    for _ in range(rows):
+        words = rng.choice(WORDS, size=max(1, length // 8))
+        text = " ".join(words)[:length]
+        cuts = sorted(rng.integers(1, max(2, len(text)), size=max(1, length // 80)))
+        parts, last = [], 0
+        for cut in cuts:
+            cut = text.find(" ", cut)
+            if cut <= last:
+                continue
+            parts.append(text[last:cut].strip())
+            last = cut
+        parts.append(text[last:].strip())
+        out.append(" | ".join(p for p in parts if p))
+    return out
+
+
+def synthetic_frame(rows, text_length=200, seed=0):
+    """A DataFrame shaped like the real sheet with ``rows`` distinct projects."""
+    rng = np.random.default_rng(seed)
+    po = rng.uniform(50, 5000, rows).round(6)
+    billed = rng.uniform(0, 1, rows)
+    billed_till = (po * billed).round(6)
+    open_ar = np.where(rng.random(rows) < 0.5, 0, rng.integers(1, 500, rows)).astype(float)
+    names = [f"Project {i:06d}" for i in range(rows)]
+    return pd.DataFrame({
+        "SN": np.arange(1, rows + 1),
+        "Project": [f"PRJ{i:06d}" for i in range(rows)],
+        "search_db": names,
+        "Project1": [n.upper() for n in names],
+        "Region": rng.choice(REGIONS, rows),
+        "Type": rng.choice(TYPES, rows),
+        "Total PO Amt": po,
+        "Billed Till Date": billed_till,
+        "Accrual": rng.integers(0, 100, rows),
+        "Total Revenue": billed_till,
+        "Open AR": open_ar,
+        "Open Billing": (po - billed_till).round(6),
+        "Billed YTD_FY25-26": (billed_till * 0.2).round(6),
+        "Current Month Billing": rng.uniform(-5, 50, rows).round(6),
+        "Project Duration": rng.choice(["12 Months", "24 Months", "36 Months", "2 Years"], rows),
+        "Billed": billed,
+        "Billing Milestone": rng.choice(["Monthly", "Quarterly", "On delivery"], rows),
+        "Project Dates": "Start Date (PO) : 01-Apr-24 :: End Date (PO) : 31-Mar-27",
+        "Resource": rng.integers(1, 60, rows).astype(str),
+        "Milestone billing amount": [f"{v:.2f} L" for v in rng.uniform(1, 50, rows)],
+        "Scope": _sentences(rng, rows, text_length),
+        "Overall Progress": _sentences(rng, rows, text_length),
+        "Weekly Plan": _sentences(rng, rows, text_length),
+        "Technology / tools": rng.choice(["Java, Spring, MySQL", "Node JS, React, Oracle", ".NET, MSSQL"], rows),
+        "Challenges / Risks": _sentences(rng, rows, text_length),
+        "Update Date": pd.Timestamp("2026-01-01") + pd.to_timedelta(rng.integers(0, 180, rows), unit="D"),
+        "Profit_YTD MIS": rng.uniform(-0.3, 0.6, rows),
+        "Profit_FY24-25_MIS": rng.uniform(-0.3, 0.6, rows),
+        "search_db1": names,
+        "Project Manager / Lead": rng.choice(["Amit K", "Dhananjay J", "Priya S", "Rahul M"], rows),
+    }, columns=COLUMNS)
+
+
+def write_workbook(path, rows, text_length=200, seed=0):
+    synthetic_frame(rows, text_length, seed).to_excel(path, index=False, sheet_name="Data_summary")
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic Dashboard_data.xlsx.")
+    parser.add_argument("rows", type=int)
+    parser.add_argument("-o", "--output", help="output path (default: synthetic_<rows>.xlsx)")
+    parser.add_argument("--text-length", type=int, default=200, help="characters per long text cell")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    path = args.output or f"synthetic_{args.rows}.xlsx"
+    write_workbook(path, args.rows, args.text_length, args.seed)
+    print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""Shared data and rendering layer for the project dashboards.
+
+Log records of every ``dashboard.*`` module go to stderr at
+``DASHBOARD_LOG_LEVEL`` (default INFO). Streamlit leaves the root logger
+without handlers, so without this they would be dropped.
+"""
+import logging
+import os
+
+LOG_LEVEL = os.environ.get("DASHBOARD_LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+_log = logging.getLogger(__name__)
+if not _log.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    _log.addHandler(_handler)
+    _log.setLevel(LOG_LEVEL)
+    # Handled here; a root handler (e.g. basicConfig in dashboard.api) would print them twice.
+    _log.propagate = False
@@ -0,0 +1,173 @@
+"""Read-only JSON/CSV API over the normalized project data.
+
+    python -m dashboard.api --port 8502
+
+Runs next to the dashboard on the same loader and data store, so other
+tools don't have to scrape the Streamlit page (a full script rerun per
+request). Endpoints, all GET, JSON by default or CSV with ``?format=csv``:
+
+    /projects                  one summary row per project
+    /projects/{name}           every normalized column of one project (URL-encoded name)
+    /aggregates/regions        portfolio KPIs by Region
+    /aggregates/types          ... by Type
+    /aggregates/totals         ... for the whole portfolio
+    /health                    source, data version and its in-memory size
+    /metrics                   stage latency percentiles of this process (dashboard.timing)
+
+Bodies are serialized and gzipped once per data version and kept with their
+ETag, so a request is a dictionary lookup; ``If-None-Match`` gets a 304.
+"""
+import argparse
+import gzip
+import hashlib
+import logging
+
+import tornado.ioloop
+import tornado.web
+
+from dashboard.compact import footprint
+from dashboard.index import project_index
+from dashboard.loader import DATA_SOURCE
+from dashboard.portfolio import portfolio_summary
+from dashboard.store import get_store
+from dashboard.timing import summary
+
+log = logging.getLogger(__name__)
+
+SUMMARY_COLUMNS = ["Project", "Project1", "Region", "Type", "Billed", "Total PO Amt",
+                   "Billed Till Date", "Open Billing", "Open AR", "Update Date"]
+CONTENT_TYPES = {"json": "application/json; charset=utf-8", "csv": "text/csv; charset=utf-8"}
+# Smaller bodies aren't worth a Content-Encoding.
+GZIP_MIN_BYTES = 512
+
+
+class Body:
+    """A serialized response: raw and gzipped bytes plus a strong ETag."""
+
+    def __init__(self, data, fmt):
+        self.data = data
+        self.gzipped = gzip.compress(data, compresslevel=6) if len(data) >= GZIP_MIN_BYTES else None
+        self.etag = '"' + hashlib.blake2b(data, digest_size=12).hexdigest() + '"'
+        self.content_type = CONTENT_TYPES[fmt]
+
+
+def _serialize(frame, fmt, index=False):
+    if fmt == "csv":
+        return frame.to_csv(index=index).encode("utf-8")
+    if index:
+        frame = frame.reset_index()
+    return frame.to_json(orient="records", date_format="iso", force_ascii=False).encode("utf-8")
+
+
+def _serialize_row(row, fmt):
+    if fmt == "csv":
+        return _serialize(row.to_frame().T, fmt)
+    return row.to_json(date_format="iso", force_ascii=False).encode("utf-8")
+
+
+def _aggregate(summary, which):
+    if which == "totals":
+        if summary.totals is None:
+            return None
+        return summary.totals.to_frame().T.astype({"Projects": "int64", "Open AR Projects": "int64"})
+    return summary.by_region if which == "regions" else summary.by_type
+
+
+def body_for(entry, key):
+    """``Body`` for ``(endpoint, argument, format)`` of one data version, built on first use."""
+    bodies = entry.derived.setdefault("api_bodies", {})
+    body = bodies.get(key)
+    if body is None:
+        endpoint, arg, fmt = key
+        if endpoint == "projects":
+            data = _serialize(entry.df[SUMMARY_COLUMNS].drop_duplicates("Project"), fmt)
+        elif endpoint == "project":
+            row = project_index(entry).row(arg)
+            if row is None:
+                return None
+            data = _serialize_row(row, fmt)
+        else:
+            frame = _aggregate(portfolio_summary(entry), arg)
+            if frame is None:
+                return None
+            # Region/Type breakdowns keep their group as the first column.
+            data = _serialize(frame, fmt, index=arg != "totals")
+        body = bodies[key] = Body(data, fmt)
+    return body
+
+
+class DataHandler(tornado.web.RequestHandler):
+    """Serves a cached ``Body`` for the current data version."""
+
+    def initialize(self, store, endpoint):
+        self.store = store
+        self.endpoint = endpoint
+
+    def compute_etag(self):
+        # ETags are precomputed per body; don't hash the response again.
+        return None
+
+    def get(self, arg=None):
+        fmt = self.get_argument("format", "json")
+        if fmt not in CONTENT_TYPES:
+            raise tornado.web.HTTPError(400, reason="format must be json or csv")
+        body = body_for(self.store.current(), (self.endpoint, arg, fmt))
+        if body is None:
+            raise tornado.web.HTTPError(404)
+
+        self.set_header("Content-Type", body.content_type)
+        self.set_header("ETag", body.etag)
+        self.set_header("Cache-Control", "no-cache")
+        self.set_header("Vary", "Accept-Encoding")
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+        if body.gzipped is not None and "gzip" in self.request.headers.get("Accept-Encoding", ""):
+            self.set_header("Content-Encoding", "gzip")
+            self.write(body.gzipped)
+        else:
+            self.write(body.data)
+
+
+class HealthHandler(tornado.web.RequestHandler):
+    def initialize(self, store):
+        self.store = store
+
+    def get(self):
+        entry = self.store.current()
+        self.write({"source": str(self.store.source), "version": entry.version, "rows": len(entry.df),
+                    "memory_bytes": footprint(entry)["total"]})
+
+
+class MetricsHandler(tornado.web.RequestHandler):
+    def get(self):
+        self.write(summary())
+
+
+def make_app(store):
+    return tornado.web.Application([
+        (r"/projects/?", DataHandler, {"store": store, "endpoint": "projects"}),
+        (r"/projects/([^/]+)", DataHandler, {"store": store, "endpoint": "project"}),
+        (r"/aggregates/(regions|types|totals)", DataHandler, {"store": store, "endpoint": "aggregates"}),
+        (r"/health", HealthHandler, {"store": store}),
+        (r"/metrics", MetricsHandler),
+    ])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the normalized project data as JSON/CSV.")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--address", default="0.0.0.0")
+    parser.add_argument("--source", default=DATA_SOURCE, help="source spec (see dashboard.loader)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    store = get_store(args.source)
+    store.current()  # load before accepting requests
+    make_app(store).listen(args.port, address=args.address, xheaders=True)
+    log.info("Serving %s on %s:%d", args.source, args.address, args.port)
+    tornado.ioloop.IOLoop.current().start()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Static assets (logo, stylesheets), read and fingerprinted once per process.
+
+With ``server.enableStaticServing`` (see .streamlit/config.toml, which
+Streamlit reads from the directory it is started in) it serves the
+``static/`` directory at ``app/static/``. The logo is linked from there with a
+``?v=<digest>`` query, which Tornado answers with far-future cache headers, so
+a browser downloads it once instead of receiving it base64-inlined twice on
+every rerun. Without static serving it falls back to a data URI.
+
+The logo markup and every stylesheet a page uses are emitted as one block
+whose text is built once per process; identical blocks are cheap for
+Streamlit to resend on reruns.
+"""
+import base64
+import hashlib
+import mimetypes
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+LOGO = "logo.png"
+
+
+@lru_cache(maxsize=None)
+def read_asset(name):
+    return (STATIC_DIR / name).read_bytes()
+
+
+@lru_cache(maxsize=None)
+def fingerprint(name):
+    """Short content digest, used to bust browser caches when the file changes."""
+    return hashlib.sha256(read_asset(name)).hexdigest()[:12]
+
+
+@lru_cache(maxsize=None)
+def asset_url(name):
+    if st.get_option("server.enableStaticServing"):
+        return f"./app/static/{name}?v={fingerprint(name)}"
+    mime = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    return f"data:{mime};base64,{base64.b64encode(read_asset(name)).decode()}"
+
+
+@lru_cache(maxsize=None)
+def page_head(*stylesheets):
+    """HTML for the logo plus ``logo.css`` and ``stylesheets`` in a single <style> block."""
+    css = "\n".join(read_asset(name).decode("utf-8") for name in ("logo.css", *stylesheets))
+    # A blank line would end the HTML block in markdown.
+    css = "\n".join(line for line in css.splitlines() if line.strip())
+    logo = asset_url(LOGO)
+    return (
+        f"<style>\n{css}\n</style>\n"
+        f'<div class="fixed-logo"><img src="{logo}" width="100" alt="Company logo"></div>\n'
+        f'<div class="print-logo-inline"><img src="{logo}" width="100" alt="Company logo"></div>'
+    )
+
+
+def emit_head(*stylesheets):
+    """Put the logo and the page's stylesheets on the page."""
+    st.markdown(page_head(*stylesheets), unsafe_allow_html=True)
@@ -0,0 +1,86 @@
+"""Row fingerprints and the diff between two data versions.
+
+Every normalized row is hashed once per version; comparing the hashes of two
+versions tells the derived structures (index, aggregates, search, reports)
+which projects were added, removed or edited, so a refresh only rebuilds the
+entries those projects touch instead of the whole portfolio.
+"""
+import hashlib
+from collections import defaultdict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+# ``rows`` holds the positions of edited rows when no row was added, removed
+# or moved (the common "someone edited a cell" refresh), and is None otherwise.
+Changes = namedtuple("Changes", ["added", "removed", "changed", "rows"])
+
+
+def row_hashes(entry):
+    """uint64 hash of every normalized row of a ``CachedWorkbook``."""
+    hashes = entry.derived.get("row_hashes")
+    if hashes is None:
+        hashes = entry.derived["row_hashes"] = pd.util.hash_pandas_object(entry.df, index=False).to_numpy()
+    return hashes
+
+
+def project_fingerprints(entry):
+    """Project -> hex digest of its rows, stable across processes and runs."""
+    fingerprints = entry.derived.get("project_fingerprints")
+    if fingerprints is None:
+        rows = defaultdict(list)
+        for project, digest in zip(entry.df["Project"].tolist(), row_hashes(entry).tolist()):
+            rows[project].append(digest)
+        fingerprints = entry.derived["project_fingerprints"] = {
+            project: hashlib.blake2b(np.array(digests, dtype=np.uint64).tobytes(), digest_size=8).hexdigest()
+            for project, digests in rows.items()
+        }
+    return fingerprints
+
+
+def diff(previous, entry):
+    """``Changes`` from ``previous`` to ``entry``."""
+    # ``equals`` rather than ``==``: blank Project cells are NA, which don't compare.
+    if previous.df["Project"].equals(entry.df["Project"]):
+        rows = np.flatnonzero(row_hashes(previous) != row_hashes(entry)).tolist()
+        return Changes(set(), set(), set(entry.df["Project"].iloc[rows]), rows)
+
+    old, new = project_fingerprints(previous), project_fingerprints(entry)
+    return Changes(
+        added=new.keys() - old.keys(),
+        removed=old.keys() - new.keys(),
+        changed={project for project in new.keys() & old.keys() if new[project] != old[project]},
+        rows=None,
+    )
+
+
+def changes_since(entry, previous):
+    """Return the ``Changes`` since ``previous``, or None if there is nothing to diff against."""
+    if previous is None or previous is entry:
+        return None
+    found = entry.derived.get("changes")
+    if found is None:
+        found = entry.derived["changes"] = diff(previous, entry)
+    return found
+
+
+def affected(changes):
+    return changes.added | changes.removed | changes.changed
+
+
+def columns_changed(previous, entry, changes, columns):
+    """Whether an edit touched any of ``columns``; always True when rows were added, removed or moved."""
+    if changes.rows is None:
+        return True
+    old = previous.df[columns].iloc[changes.rows].reset_index(drop=True)
+    new = entry.df[columns].iloc[changes.rows].reset_index(drop=True)
+    return not old.equals(new)
+
+
+def touched_groups(previous, entry, changes, column):
+    """Values of ``column`` held by any affected project, before or after the change."""
+    projects = affected(changes)
+    groups = set()
+    for df in (previous.df, entry.df):
+        groups.update(df.loc[df["Project"].isin(projects), column].unique())
+    return groups
@@ -0,0 +1,40 @@
+"""Compact in-memory layout of a loaded data version.
+
+Each version is held once per process and shared by every session (see
+dashboard.store), so its size is what grows with the data, not with users.
+``compact`` keeps only the columns the pages read (the schema plus
+``Source``), stores low-cardinality keys such as Region and Type as
+categoricals and free text as Arrow-backed strings. Row hashes are the same
+as for the object columns they replace, so fingerprints (dashboard.changes)
+don't move. Treat the result as read-only: it is handed to every session.
+"""
+from dashboard.schema import SCHEMA, columns_of
+
+# Key columns with at most this share of distinct values become categoricals.
+CATEGORY_RATIO = 0.5
+STRING_DTYPE = "string[pyarrow]"
+EXTRA_COLUMNS = ["Source"]
+
+
+def compact(df):
+    """Copy of ``df`` with schema columns only, keys as categoricals and text as Arrow strings."""
+    df = df[[col for col in df.columns if col in SCHEMA or col in EXTRA_COLUMNS]]
+    converted = {}
+    for col in columns_of("key") + EXTRA_COLUMNS:
+        if col in df:
+            low = df[col].nunique() <= len(df) * CATEGORY_RATIO
+            converted[col] = df[col].astype("category" if low else STRING_DTYPE)
+    for col in columns_of("text"):
+        # Numeric-only text columns (e.g. a head count) keep their dtype and formatting.
+        if df[col].dtype == object:
+            converted[col] = df[col].astype(STRING_DTYPE)
+    return df.assign(**converted)
+
+
+def footprint(entry):
+    """{column: bytes} of a ``CachedWorkbook``'s frame, plus ``"total"``; computed once per version."""
+    usage = entry.derived.get("footprint")
+    if usage is None:
+        by_column = entry.df.memory_usage(deep=True, index=False)
+        usage = entry.derived["footprint"] = {**by_column.to_dict(), "total": int(by_column.sum())}
+    return usage
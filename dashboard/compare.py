@@ -0,0 +1,45 @@
+"""Side-by-side comparison of projects, straight from the normalized columns.
+
+One table per data version holds the compared figures of every project
+(indexed by Project, first row per project like the project page), so
+adding a project to a comparison is a ``.loc`` lookup rather than another
+rerun of the project page.
+"""
+import pandas as pd
+
+from dashboard.index import project_index
+from dashboard.render import format_resource
+
+# Table column -> normalized column (see dashboard.schema / dashboard.normalize).
+COLUMNS = {
+    "Name": "Project1",
+    "PO Amt": "Total PO Amt",
+    "Billing Done": "Billed Till Date",
+    "Open Billing": "Open Billing",
+    "Billed %": "Billed",
+    "Open AR": "Open AR",
+    "Profit YTD %": "Profit_YTD MIS",
+    "Resources Deployed": "Resource",
+}
+
+
+def comparison_frame(entry):
+    """Every project's compared figures for a ``CachedWorkbook``, built once per version."""
+    frame = entry.derived.get("comparison_frame")
+    if frame is None:
+        index = project_index(entry)
+        rows = entry.df.iloc[[index.positions[project] for project in index.projects]]
+        frame = (rows[list(COLUMNS.values())]
+                 .set_axis(list(COLUMNS), axis=1)
+                 .set_axis(pd.Index(index.projects, name="Project")))
+        # Head count or free text, shown as on the project page.
+        frame["Resources Deployed"] = [format_resource(value if pd.notna(value) else None)
+                                       for value in rows["Resource"].tolist()]
+        entry.derived["comparison_frame"] = frame
+    return frame
+
+
+def comparison(entry, projects):
+    """Rows of ``projects`` (in the given order) that exist in this version."""
+    frame = comparison_frame(entry)
+    return frame.loc[[project for project in projects if project in frame.index]]
@@ -0,0 +1,31 @@
+"""Optional debug panel: add ``?debug=1`` to the page URL (or set DASHBOARD_DEBUG=1)."""
+import os
+
+import streamlit as st
+
+from dashboard import timing
+
+
+def debug_enabled():
+    return os.environ.get("DASHBOARD_DEBUG") == "1" or st.query_params.get("debug") == "1"
+
+
+def timing_panel(run, dataset=None):
+    """Sidebar expander with this run's stage times, per-stage percentiles and the data's memory use."""
+    if not debug_enabled():
+        return
+    import pandas as pd
+
+    from dashboard.compact import footprint
+    from dashboard.fragments import cache_stats
+
+    with st.sidebar.expander("⏱️ Timing", expanded=True):
+        st.markdown("**This run (ms)**")
+        st.dataframe(pd.Series(run.stages, name="ms").round(2), use_container_width=True)
+        st.markdown(f"**Last {timing.WINDOW} samples per stage (ms)**")
+        st.dataframe(pd.DataFrame(timing.summary()).T, use_container_width=True)
+        st.markdown("**Rendered-view cache**")
+        st.json(cache_stats())
+        if dataset is not None:
+            st.markdown(f"**Data version {dataset.version} in memory (KiB)**")
+            st.dataframe((pd.Series(footprint(dataset), name="KiB") / 1024).round(1), use_container_width=True)
@@ -0,0 +1,96 @@
+"""Faceted filtering over the project list with precomputed bitmaps.
+
+Every facet value (a Region, a Type, a Billed % band, an Open AR status)
+holds one bitmap over the sorted project list: bit ``i`` is set when
+``projects[i]`` has that value. Built once per data version; a rerun then
+filters and recounts with a few integer ANDs/ORs and ``bit_count`` calls,
+whatever the number of projects. Values within a facet are OR-ed, facets are
+AND-ed, and each facet's counts apply the selections of the other facets
+only (so picking "North" still shows how many projects every other Region has).
+"""
+import numpy as np
+import pandas as pd
+
+from dashboard.index import project_index
+
+# (label, lowest whole percent) from the top; blanks are "N/A".
+BILLED_BANDS = [("100%", 100), ("75–99%", 75), ("50–74%", 50), ("25–49%", 25), ("< 25%", -100)]
+BILLED_NA = "N/A"
+OPEN_AR = "Open AR"
+NO_OPEN_AR = "No open AR"
+FACETS = ["Region", "Type", "Billed %", "Open AR status"]
+
+
+def billed_band(billed):
+    """Band label of each whole Billed percent (see dashboard.normalize)."""
+    billed = billed.astype("float64")
+    labels = pd.Series(BILLED_NA, index=billed.index, dtype=object)
+    for label, low in reversed(BILLED_BANDS):
+        labels[billed >= low] = label
+    return labels
+
+
+def _bitmap(flags):
+    """Python int with bit ``i`` set where ``flags[i]``."""
+    return int.from_bytes(np.packbits(flags, bitorder="little").tobytes(), "little")
+
+
+class FacetIndex:
+    """Bitmaps of every facet value over ``ProjectIndex.projects``."""
+
+    def __init__(self, index):
+        self.projects = index.projects
+        self._names = np.array(self.projects, dtype=object)
+        rows = index.df.iloc[[index.positions[project] for project in self.projects]]
+        labels = {
+            "Region": rows["Region"].astype(str).to_numpy(),
+            "Type": rows["Type"].astype(str).to_numpy(),
+            "Billed %": billed_band(rows["Billed"]).to_numpy(),
+            "Open AR status": np.where(rows["Open AR"].fillna(0).ne(0), OPEN_AR, NO_OPEN_AR),
+        }
+        self.options = {
+            "Region": sorted(set(labels["Region"])),
+            "Type": sorted(set(labels["Type"])),
+            "Billed %": [label for label, _ in BILLED_BANDS] + [BILLED_NA],
+            "Open AR status": [OPEN_AR, NO_OPEN_AR],
+        }
+        self.bitmaps = {
+            facet: {value: _bitmap(labels[facet] == value) for value in options}
+            for facet, options in self.options.items()
+        }
+        self.everything = (1 << len(self.projects)) - 1
+
+    def _mask(self, selected, skip=None):
+        mask = self.everything
+        for facet, values in selected.items():
+            if values and facet != skip:
+                union = 0
+                for value in values:
+                    union |= self.bitmaps[facet].get(value, 0)
+                mask &= union
+        return mask
+
+    def counts(self, selected):
+        """{facet: {value: projects}} under the selections of the other facets."""
+        counts = {}
+        for facet, bitmaps in self.bitmaps.items():
+            mask = self._mask(selected, skip=facet)
+            counts[facet] = {value: (bitmap & mask).bit_count() for value, bitmap in bitmaps.items()}
+        return counts
+
+    def matching(self, selected):
+        """Projects matching every selection ({facet: [values]}; empty means any), in list order."""
+        mask = self._mask(selected)
+        if mask == self.everything:
+            return self.projects
+        flags = np.unpackbits(np.frombuffer(mask.to_bytes(len(self.projects) // 8 + 1, "little"), np.uint8),
+                              bitorder="little")
+        return self._names[flags[:len(self.projects)].astype(bool)].tolist()
+
+
+def facet_index(entry):
+    """Return the ``FacetIndex`` for a ``CachedWorkbook``, building it once (vectorized, so no diffing)."""
+    index = entry.derived.get("facet_index")
+    if index is None:
+        index = entry.derived["facet_index"] = FacetIndex(project_index(entry))
+    return index
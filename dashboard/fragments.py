@@ -0,0 +1,87 @@
+"""Process-wide LRU cache of rendered project views.
+
+Building a view formats every amount and runs the sentence-break regex over
+each free-text cell. Views are cached per project, its row fingerprint (see
+``dashboard.changes``) and layout options, so reruns of the same project and
+refreshes that didn't touch it reuse the rendered HTML. The least recently
+used views are evicted once the cache goes over its memory cap.
+"""
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+from dashboard.changes import project_fingerprints
+from dashboard.index import project_index
+from dashboard.render import project_view
+
+# Cap on the estimated size of all cached views.
+MAX_BYTES = int(float(os.environ.get("DASHBOARD_FRAGMENT_CACHE_MB", "32")) * 1024 * 1024)
+
+
+def _size(value):
+    """Rough deep size of a view; the strings dominate."""
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_size(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class FragmentCache:
+    """LRU of built values bounded by their estimated size in bytes."""
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()  # key -> (value, size)
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """Cached value for ``key``, calling ``build()`` on a miss."""
+        with self._lock:
+            found = self._items.get(key)
+            if found is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return found[0]
+            self.misses += 1
+
+        # Built outside the lock; two sessions missing together both build, one is kept.
+        value = build()
+        size = _size(value)
+        with self._lock:
+            if key not in self._items and size <= self.max_bytes:
+                self._items[key] = (value, size)
+                self.bytes += size
+                while self.bytes > self.max_bytes:
+                    _, (_, evicted) = self._items.popitem(last=False)
+                    self.bytes -= evicted
+        return value
+
+    def stats(self):
+        return {"views": len(self._items), "KB": round(self.bytes / 1024, 1), "hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.bytes = 0
+
+
+_views = FragmentCache()
+
+
+def cached_view(entry, project, show_profit=True, show_challenges=True, escape=None):
+    """``project_view`` of ``project`` in a ``CachedWorkbook``, or None if it isn't there."""
+    fingerprint = project_fingerprints(entry).get(project)
+    if fingerprint is None:
+        return None
+    key = (project, fingerprint, show_profit, show_challenges, escape)
+    return _views.get(key, lambda: project_view(project_index(entry).row(project), show_profit=show_profit,
+                                                show_challenges=show_challenges, escape=escape))
+
+
+def cache_stats():
+    return _views.stats()
@@ -0,0 +1,162 @@
+"""Dated history of the tracked figures, kept across data versions.
+
+Every published version is recorded into an append-only Parquet store keyed
+by Project and Update Date: each load that brings new or revised rows writes
+one small part file, and nothing is rewritten until ``compact``. The parts
+are read once per process into a sorted (Project, Update Date) index, so a
+project's trend is an index slice rather than a re-read of old workbooks::
+
+    python -m dashboard.history add old/*.xlsx    # backfill from old workbooks
+    python -m dashboard.history compact           # merge the parts into one file
+
+``DASHBOARD_HISTORY_DIR`` moves the store; set it empty to turn history off.
+"""
+import argparse
+import io
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+log = logging.getLogger(__name__)
+
+HISTORY_DIR = os.environ.get(
+    "DASHBOARD_HISTORY_DIR", str(Path(__file__).resolve().parent.parent / "data" / "history")
+)
+KEY = ["Project", "Update Date"]
+VALUES = ["Billed", "Open Billing", "Open AR", "Total PO Amt", "Billed Till Date"]
+RECORDED = "Recorded At"
+PART_GLOB = "part-*.parquet"
+
+
+class History:
+    """Append-only (Project, Update Date) store with an in-memory time index."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._frame = None
+
+    def _read(self):
+        parts = sorted(self.root.glob(PART_GLOB))
+        if not parts:
+            return pd.DataFrame(columns=[*KEY, *VALUES, RECORDED]).set_index(KEY)
+        frame = pd.concat([pq.read_table(part).to_pandas() for part in parts], ignore_index=True)
+        # Later parts revise earlier ones for the same project and date.
+        frame = frame.sort_values(RECORDED, kind="stable").drop_duplicates(KEY, keep="last")
+        return frame.set_index(KEY).sort_index()
+
+    @property
+    def frame(self):
+        if self._frame is None:
+            with self._lock:
+                if self._frame is None:
+                    self._frame = self._read()
+        return self._frame
+
+    def record(self, df):
+        """Append the rows of ``df`` that are new or changed; returns how many were written."""
+        rows = df.loc[df["Update Date"].notna(), [*KEY, *VALUES]]
+        # Duplicate project rows: the pages show the first one.
+        rows = rows.drop_duplicates(KEY).set_index(KEY)
+        frame = self.frame
+        with self._lock:
+            known = frame[VALUES].reindex(rows.index).astype("float64")
+            values = rows.astype("float64")
+            same = (known.eq(values) | (known.isna() & values.isna())).all(axis=1)
+            fresh = rows[~same].assign(**{RECORDED: pd.Timestamp.now().floor("s")})
+            if fresh.empty:
+                return 0
+            self.root.mkdir(parents=True, exist_ok=True)
+            part = self.root / f"part-{time.strftime('%Y%m%dT%H%M%S')}-{time.time_ns() % 10**9:09d}.parquet"
+            pq.write_table(pa.Table.from_pandas(fresh.reset_index(), preserve_index=False), part)
+            merged = fresh if frame.empty else pd.concat([frame.drop(fresh.index, errors="ignore"), fresh])
+            self._frame = merged.sort_index()
+        return len(fresh)
+
+    def trend(self, project):
+        """The project's figures indexed by Update Date (oldest first); empty if unknown."""
+        frame = self.frame
+        try:
+            return frame.loc[project, VALUES]
+        except KeyError:
+            return frame.iloc[:0][VALUES].droplevel(0)
+
+    def compact(self):
+        """Rewrite every part as one file; returns the number of parts merged."""
+        with self._lock:
+            parts = sorted(self.root.glob(PART_GLOB))
+            if len(parts) < 2:
+                return len(parts)
+            frame = self._read()
+            merged = self.root / f"part-{time.strftime('%Y%m%dT%H%M%S')}-compacted.parquet"
+            pq.write_table(pa.Table.from_pandas(frame.reset_index(), preserve_index=False), merged)
+            for part in parts:
+                part.unlink()
+            self._frame = frame
+        return len(parts)
+
+
+_histories = {}
+_histories_lock = threading.Lock()
+
+
+def get_history(root=None):
+    """Shared ``History`` for ``root`` (default ``HISTORY_DIR``), or None when history is turned off."""
+    root = HISTORY_DIR if root is None else root
+    if not root:
+        return None
+    with _histories_lock:
+        history = _histories.get(root)
+        if history is None:
+            history = _histories[root] = History(root)
+    return history
+
+
+def project_trend(project):
+    """Trend of ``project`` from the shared history; empty when history is off."""
+    history = get_history()
+    return history.trend(project) if history is not None else pd.DataFrame(columns=VALUES)
+
+
+def record_version(entry):
+    """Record a published ``CachedWorkbook``; history must never block publishing."""
+    history = get_history()
+    if history is None:
+        return
+    try:
+        written = history.record(entry.df)
+    except (OSError, pa.ArrowException, ValueError) as exc:
+        log.warning("Could not record version %s in history: %s", entry.version, exc)
+        return
+    if written:
+        log.info("Recorded %d dated row(s) of version %s in history", written, entry.version)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain the dated project history.")
+    parser.add_argument("--dir", default=HISTORY_DIR, help="history directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("add", help="record workbooks (oldest first)")
+    add.add_argument("workbooks", nargs="+")
+    commands.add_parser("compact", help="merge the part files into one")
+    args = parser.parse_args(argv)
+
+    history = History(args.dir)
+    if args.command == "add":
+        from dashboard.workbook import read_workbook
+
+        for workbook in args.workbooks:
+            written = history.record(read_workbook(io.BytesIO(Path(workbook).read_bytes())))
+            print(f"{workbook}: {written} row(s) recorded")
+    else:
+        print(f"Compacted {history.compact()} part(s) in {args.dir}")
+
+
+if __name__ == "__main__":
+    main()
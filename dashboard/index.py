@@ -0,0 +1,71 @@
+"""Per-version lookups so reruns don't rescan the whole frame.
+
+Everything here is derived from one loaded workbook version and cached on
+its ``CachedWorkbook``. A new version is built from the previous one when the
+store can diff them (see ``dashboard.changes``), otherwise from scratch.
+"""
+import copy
+
+from dashboard.changes import changes_since, columns_changed, touched_groups
+
+
+class ProjectIndex:
+    """Project -> row position, plus the sidebar's Region/Type project counts."""
+
+    def __init__(self, df):
+        self.df = df
+        self.positions = {}
+        for pos, name in enumerate(df["Project"].tolist()):
+            # Duplicate project rows: the pages always showed the first one.
+            self.positions.setdefault(name, pos)
+        self.projects = sorted(df["Project"].dropna().unique().tolist())
+        self.region_counts = _counts(df, "Region")
+        self.type_counts = _counts(df, "Type")
+
+    def row(self, project):
+        """Row for ``project`` as a Series, or None if it isn't in this version."""
+        pos = self.positions.get(project)
+        return None if pos is None else self.df.iloc[pos]
+
+    def updated(self, previous, entry, changes):
+        """Index for ``entry``, recounting only the Regions/Types the changed projects touch."""
+        index = copy.copy(self)
+        index.df = entry.df
+        if changes.rows is None:
+            index.positions = {}
+            for pos, name in enumerate(entry.df["Project"].tolist()):
+                index.positions.setdefault(name, pos)
+        if changes.added or changes.removed:
+            index.projects = sorted(entry.df["Project"].dropna().unique().tolist())
+        if columns_changed(previous, entry, changes, ["Project", "Region", "Type"]):
+            index.region_counts = _recount(self.region_counts, previous, entry, changes, "Region")
+            index.type_counts = _recount(self.type_counts, previous, entry, changes, "Type")
+        return index
+
+
+def _counts(df, column):
+    return df.groupby(column, observed=True)["Project"].nunique().to_dict()
+
+
+def _recount(counts, previous, entry, changes, column):
+    groups = touched_groups(previous, entry, changes, column)
+    if not groups:
+        return counts
+    counts = {group: n for group, n in counts.items() if group not in groups}
+    counts.update(_counts(entry.df[entry.df[column].isin(groups)], column))
+    return dict(sorted(counts.items()))
+
+
+def project_index(entry, previous=None):
+    """Return the ``ProjectIndex`` for a ``CachedWorkbook``, building it once.
+
+    With the ``previous`` version at hand only the changed projects are reindexed.
+    """
+    index = entry.derived.get("project_index")
+    if index is None:
+        changes = changes_since(entry, previous)
+        old = previous.derived.get("project_index") if changes is not None else None
+        index = entry.derived["project_index"] = (
+            old.updated(previous, entry, changes) if old is not None else ProjectIndex(entry.df)
+        )
+    return index
@@ -0,0 +1,360 @@
+"""Cached workbook loader shared by every dashboard session.
+
+Streamlit re-executes the page script on every widget interaction, but
+imported modules stay in ``sys.modules`` for the life of the server process.
+Keeping the cache here means one parsed DataFrame per source is shared by all
+sessions, and a rerun only pays for a cheap dictionary lookup.
+
+A source spec names one or more workbooks, separated by ``;``. Each may be
+a URL, a file or a directory (every ``*.xlsx`` in it), optionally followed by
+``#Sheet`` (one sheet), ``#A,B`` (several) or ``#*`` (all sheets); the
+default is the first sheet. Parts that changed are parsed concurrently in a
+process pool and the results are concatenated into one frame, with a
+``Source`` column saying where each row came from: the workbook's file name
+(plus ``#Sheet`` for a named sheet), or its path or URL as written when two
+workbooks of the spec share a file name.
+
+Loads are single-flight per source spec: sessions that find the same spec
+cold or expired at the same moment wait on one revalidation (one fetch, one
+parse) instead of each starting their own; different specs load side by
+side. Specs that share a workbook revalidate it separately, so overlapping
+specs loaded at the same moment may parse it twice.
+
+Local files need no network: point ``DASHBOARD_DATA_SOURCE`` at the bundled
+``data/Dashboard_data.xlsx`` (or any path or directory), or at a local HTTP
+stand-in such as ``python -m http.server -d data``, whose Last-Modified
+headers are revalidated like GitHub's ETags. The data store watches local
+sources for changes (see ``dashboard.watch``).
+"""
+import io
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+import requests
+
+from dashboard.compact import compact
+from dashboard.singleflight import SingleFlight
+from dashboard.snapshot import read_snapshot, snapshot_location, source_digest
+from dashboard.timing import timed
+from dashboard.workbook import read_workbook
+
+log = logging.getLogger(__name__)
+
+DATA_URL = "https://raw.githubusercontent.com/avdhootr3/bsdprojects/main/data/Dashboard_data.xlsx"
+# Source spec the pages load (see module docstring); defaults to the GitHub workbook.
+DATA_SOURCE = os.environ.get("DASHBOARD_DATA_SOURCE", DATA_URL)
+BUNDLED_SOURCE = str(Path(__file__).resolve().parent.parent / "data" / "Dashboard_data.xlsx")
+# Served when the configured source can't be reached on a cold start; empty turns it off.
+FALLBACK_SOURCE = os.environ.get("DASHBOARD_FALLBACK_SOURCE", BUNDLED_SOURCE)
+
+# Seconds a cached workbook is served before the source is revalidated.
+DEFAULT_TTL = float(os.environ.get("DASHBOARD_DATA_TTL", "300"))
+FETCH_TIMEOUT = 30
+
+
+class CachedWorkbook:
+    """One parsed workbook plus the validators needed to revalidate it."""
+
+    def __init__(self, df, digest, etag=None, last_modified=None, mtime=None, version=1):
+        self.df = df
+        self.digest = digest
+        self.etag = etag
+        self.last_modified = last_modified
+        self.mtime = mtime
+        self.version = version
+        self.checked_at = time.monotonic()
+        # Part versions a combined (multi-source) entry was built from.
+        self.part_versions = None
+        # Indexes and aggregates built from this version (see dashboard.index).
+        self.derived = {}
+
+
+SOURCE_SEPARATOR = ";"
+ALL_SHEETS = "*"
+
+# Raw bytes of a workbook that changed, waiting to be parsed.
+Fetched = namedtuple("Fetched", ["data", "digest", "etag", "last_modified", "mtime", "snapshot"])
+
+_cache = {}   # source spec -> CachedWorkbook handed to the pages
+_parts = {}   # (workbook, sheet) -> CachedWorkbook
+_lock = threading.Lock()
+_pool = None
+# One revalidation in flight per source spec; concurrent callers share it.
+_flights = SingleFlight()
+
+
+def _is_url(source):
+    return str(source).startswith(("http://", "https://"))
+
+
+def expand_sources(spec):
+    """Split a source spec into ``[(workbook, sheet), ...]`` parts."""
+    parts = []
+    for item in str(spec).split(SOURCE_SEPARATOR):
+        item = item.strip()
+        if not item:
+            continue
+        source, _, sheets = item.partition("#")
+        if not _is_url(source) and Path(source).is_dir():
+            workbooks = [str(p) for p in sorted(Path(source).glob("*.xlsx")) if not p.name.startswith("~$")]
+        else:
+            workbooks = [source]
+        for workbook in workbooks:
+            for sheet in (sheets.split(",") if sheets else [0]):
+                parts.append((workbook, sheet))
+    return parts
+
+
+def split_sources(spec):
+    """``(urls, paths)`` named by a source spec; paths may be files or directories."""
+    urls, paths = [], []
+    for item in str(spec).split(SOURCE_SEPARATOR):
+        source = item.strip().partition("#")[0]
+        if source:
+            (urls if _is_url(source) else paths).append(source)
+    return urls, paths
+
+
+def _fetch_snapshot(source):
+    """Download the sibling Parquet snapshot of a workbook URL, if published."""
+    try:
+        with timed("fetch"):
+            resp = requests.get(snapshot_location(source), timeout=FETCH_TIMEOUT)
+    except requests.RequestException as exc:
+        log.info("No snapshot for %s: %s", source, exc)
+        return None
+    return resp.content if resp.ok else None
+
+
+def _parse(data, digest, sheet_name, snapshot):
+    """Prefer a snapshot built from exactly these bytes; parse the XLSX otherwise.
+
+    Snapshots only cover the first sheet. Runs in pool workers as well.
+    """
+    if sheet_name == 0 and snapshot is not None:
+        with timed("parse"):
+            df = read_snapshot(snapshot, digest)
+        if df is not None:
+            return df
+        log.info("Snapshot is missing or stale, parsing the workbook")
+    return read_workbook(io.BytesIO(data), sheet_name)
+
+
+def _sheet_names(data):
+    book = openpyxl.load_workbook(io.BytesIO(data), read_only=True)
+    try:
+        return book.sheetnames
+    finally:
+        book.close()
+
+
+def _revalidate_url(source, sheet_name, entry):
+    """Conditional GET; returns the cached entry untouched on 304."""
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+    with timed("fetch"):
+        resp = requests.get(source, headers=headers, timeout=FETCH_TIMEOUT)
+    if resp.status_code == 304 and entry is not None:
+        return entry
+    resp.raise_for_status()
+
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    digest = source_digest(resp.content)
+    if entry is not None and digest == entry.digest:
+        # Server ignored the validators but the bytes are the same.
+        entry.etag, entry.last_modified = etag, last_modified
+        return entry
+
+    snapshot = _fetch_snapshot(source) if sheet_name == 0 else None
+    return Fetched(resp.content, digest, etag, last_modified, None, snapshot)
+
+
+def _revalidate_path(source, sheet_name, entry):
+    """Local files are revalidated on modification time, then content digest."""
+    mtime = Path(source).stat().st_mtime
+    if entry is not None and entry.mtime == mtime:
+        return entry
+    with timed("fetch"):
+        data = Path(source).read_bytes()
+    digest = source_digest(data)
+    if entry is not None and digest == entry.digest:
+        entry.mtime = mtime
+        return entry
+    snapshot = snapshot_location(source) if sheet_name == 0 else None
+    return Fetched(data, digest, None, None, mtime, snapshot)
+
+
+def _revalidate(part):
+    """Cached entry if ``part`` is unchanged, ``Fetched`` bytes if it changed."""
+    source, sheet_name = part
+    entry = _parts.get(part)
+    revalidate = _revalidate_url if _is_url(source) else _revalidate_path
+    try:
+        return revalidate(source, sheet_name, entry)
+    except (requests.RequestException, OSError) as exc:
+        if entry is None:
+            raise
+        log.warning("Refreshing %s failed, serving cached copy: %s", source, exc)
+        return entry
+
+
+def _parse_pool():
+    """Process pool reused across refreshes; forkserver/spawn are safe in a threaded server."""
+    global _pool
+    with _lock:
+        if _pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            _pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context)
+        return _pool
+
+
+def _discard_pool(pool):
+    """Drop a pool whose worker died; the next ``_parse_pool()`` starts a fresh one."""
+    global _pool
+    with _lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_all(jobs):
+    """Parse ``[(data, digest, sheet, snapshot)]``; in parallel when there is more than one.
+
+    A pool whose worker died (e.g. OOM-killed) is broken for good, so it is
+    replaced and the jobs retried once; if that pool breaks too they are parsed
+    inline.
+    """
+    if len(jobs) == 1:
+        return [_parse(*jobs[0])]
+    with timed("parse"):
+        for _ in range(2):
+            pool = _parse_pool()
+            try:
+                futures = [pool.submit(_parse, *job) for job in jobs]
+                return [future.result() for future in futures]
+            except BrokenProcessPool:
+                log.warning("Parse pool broke, starting a fresh one")
+                _discard_pool(pool)
+        log.warning("Parse pool broke again, parsing %d sheets inline", len(jobs))
+        return [_parse(*job) for job in jobs]
+
+
+def _source_names(parts):
+    """Workbook -> name its rows are tagged with: the file name, or the path/URL if that is ambiguous."""
+    file_names = {workbook: workbook.rsplit("/", 1)[-1] for workbook, _ in parts}
+    taken = Counter(file_names.values())
+    return {workbook: name if taken[name] == 1 else workbook for workbook, name in file_names.items()}
+
+
+def _tag(df, name, sheet_name):
+    return df.assign(Source=name if sheet_name == 0 else f"{name}#{sheet_name}")
+
+
+def _refresh(parts, entry):
+    """Revalidate every part, parse the changed ones and (re)combine if needed."""
+    if len(parts) == 1:
+        revalidated = [_revalidate(parts[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=len(parts)) as fetchers:
+            revalidated = list(fetchers.map(_revalidate, parts))
+
+    jobs, owners = [], []
+    for i, ((_, sheet_name), result) in enumerate(zip(parts, revalidated)):
+        if isinstance(result, Fetched):
+            sheets = _sheet_names(result.data) if sheet_name == ALL_SHEETS else [sheet_name]
+            for sheet in sheets:
+                jobs.append((result.data, result.digest, sheet, result.snapshot if sheet == 0 else None))
+                owners.append((i, sheet))
+    frames = _parse_all(jobs) if jobs else []
+
+    part_entries = []
+    for i, (part, result) in enumerate(zip(parts, revalidated)):
+        if isinstance(result, Fetched):
+            # Sheets of a "#*" part are tagged "#Sheet" here; the workbook name depends on the
+            # spec (see _source_names) and is prefixed when the parts are combined.
+            pieces = [df if parts[i][1] != ALL_SHEETS else _tag(df, "", sheet)
+                      for (owner, sheet), df in zip(owners, frames) if owner == i]
+            old = _parts.get(part)
+            result = CachedWorkbook(
+                compact(pieces[0] if len(pieces) == 1 else pd.concat(pieces, ignore_index=True)),
+                result.digest, etag=result.etag, last_modified=result.last_modified, mtime=result.mtime,
+                version=old.version + 1 if old is not None else 1,
+            )
+            _parts[part] = result
+        part_entries.append(result)
+
+    # A single plain workbook is handed out as-is, so its derived data is shared.
+    if len(parts) == 1 and parts[0][1] != ALL_SHEETS:
+        return part_entries[0]
+
+    versions = tuple(e.version for e in part_entries)
+    if entry is not None and entry.part_versions == versions:
+        return entry
+    # Parts have their own categories; the combined frame is compacted again.
+    names = _source_names(parts)
+    df = compact(pd.concat(
+        [e.df.assign(Source=names[workbook] + e.df["Source"].astype(str)) if sheet == ALL_SHEETS
+         else _tag(e.df, names[workbook], sheet)
+         for (workbook, sheet), e in zip(parts, part_entries)],
+        ignore_index=True,
+    ))
+    combined = CachedWorkbook(
+        df, source_digest("".join(e.digest for e in part_entries).encode()),
+        version=entry.version + 1 if entry is not None else 1,
+    )
+    combined.part_versions = versions
+    return combined
+
+
+def load_entry(source=DATA_SOURCE, ttl=DEFAULT_TTL):
+    """Return the cached ``CachedWorkbook`` for a source spec, revalidating after ``ttl`` seconds."""
+    key = SOURCE_SEPARATOR.join(map(str, source)) if isinstance(source, (list, tuple)) else str(source)
+    entry = _cache.get(key)
+    if entry is not None and time.monotonic() - entry.checked_at < ttl:
+        return entry
+    return _flights.do(key, lambda: _load(key, ttl))
+
+
+def _load(key, ttl):
+    # A flight may have finished between the caller's check and this one starting.
+    entry = _cache.get(key)
+    if entry is not None and time.monotonic() - entry.checked_at < ttl:
+        return entry
+
+    parts = expand_sources(key)
+    if not parts:
+        raise FileNotFoundError(f"No workbooks found for {key!r}")
+    fresh = _refresh(parts, entry)
+    fresh.checked_at = time.monotonic()
+    _cache[key] = fresh
+    return fresh
+
+
+def load_workbook(source=DATA_SOURCE, ttl=DEFAULT_TTL):
+    """Return the shared DataFrame for a source spec.
+
+    The frame is shared across sessions, so callers must treat it as read-only.
+    """
+    return load_entry(source, ttl).df
+
+
+def clear_cache():
+    with _lock:
+        _cache.clear()
+        _parts.clear()
@@ -0,0 +1,69 @@
+"""Load-time type normalization, vectorized over whole columns.
+
+The pages used to parse percentages, amounts and dates one cell at a time on
+every render. Here each schema column is converted once per data version, so
+the render path only formats values that are already typed:
+
+  number   float amount (NaN when blank or not a number)
+  percent  Int64 whole percent clipped to [-100, 100]; accepts 0.67, 67,
+           "67%" and " 0.67 " (all -> 67)
+  date     datetime64; Excel serials and date-like text are parsed, anything
+           else becomes NaT
+"""
+import pandas as pd
+
+from dashboard.schema import columns_of
+
+EXCEL_EPOCH = "1899-12-30"
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def number_column(series):
+    return pd.to_numeric(series, errors="coerce").astype("float64")
+
+
+def percent_column(series):
+    if pd.api.types.is_numeric_dtype(series):
+        num = series.astype("float64")
+        has_pct = pd.Series(False, index=series.index)
+    else:
+        text = series.astype("string").str.strip()
+        has_pct = text.str.contains("%", regex=False).fillna(False).astype(bool)
+        num = pd.to_numeric(
+            text.str.replace("%", "", regex=False).str.replace(",", "", regex=False).str.strip(),
+            errors="coerce",
+        ).astype("float64")
+    # Fractions (|x| <= 1) without a % sign are scaled up to percent.
+    pct = num.where(has_pct | (num.abs() > 1), num * 100)
+    return pct.round().clip(-100, 100).astype("Int64")
+
+
+def date_column(series):
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    if pd.api.types.is_numeric_dtype(series):
+        return pd.to_datetime(series, unit="D", origin=EXCEL_EPOCH, errors="coerce")
+    is_serial = series.map(_is_number)
+    serials = pd.to_datetime(
+        pd.to_numeric(series.where(is_serial), errors="coerce"), unit="D", origin=EXCEL_EPOCH, errors="coerce"
+    )
+    parsed = pd.to_datetime(series.where(~is_serial), errors="coerce", format="mixed")
+    return serials.fillna(parsed)
+
+
+CONVERTERS = {
+    "number": number_column,
+    "percent": percent_column,
+    "date": date_column,
+}
+
+
+def normalize(df):
+    """Convert every typed schema column in place and return ``df``."""
+    for dtype, convert in CONVERTERS.items():
+        for col in columns_of(dtype):
+            df[col] = convert(df[col])
+    return df
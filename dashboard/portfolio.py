@@ -0,0 +1,118 @@
+"""Portfolio-wide KPIs aggregated from the normalized frame."""
+import copy
+
+import pandas as pd
+
+from dashboard.changes import affected, changes_since, columns_changed
+
+AMOUNT_COLUMNS = ["Total PO Amt", "Billed Till Date", "Open Billing", "Open AR"]
+# Everything the summary reads; edits to other columns leave it as it is.
+SUMMARY_COLUMNS = ["Project", "Region", "Type", "Billed", *AMOUNT_COLUMNS]
+# Groupings kept by the summary; "_all" is the single group behind the totals.
+GROUPS = ["Region", "Type", "_all"]
+
+
+def _first_rows(df):
+    """Mask of the rows that count: duplicate project rows use the first one, as on the project page."""
+    return (df["Project"].notna() & ~df["Project"].duplicated()).to_numpy()
+
+
+def _prepare(df):
+    """Helper columns for the given rows, so every aggregate below is a plain sum."""
+    billed = df["Billed"].astype("float64")
+    po = df["Total PO Amt"]
+    has_both = billed.notna() & po.notna()
+    return pd.DataFrame({
+        "Region": df["Region"],
+        "Type": df["Type"],
+        "_all": "All",
+        "Project": df["Project"],
+        **{col: df[col] for col in AMOUNT_COLUMNS},
+        "_weight": po.where(has_both, 0.0),
+        "_weighted": (billed * po).where(has_both, 0.0),
+        "_weighing": has_both,
+        "Open AR Projects": df["Open AR"].fillna(0).ne(0),
+    })
+
+
+def _sums(rows, by):
+    """Per-group sums; unlike the ratios they add and subtract across versions."""
+    columns = [*AMOUNT_COLUMNS, "_weight", "_weighted", "_weighing", "Open AR Projects"]
+    groups = rows[columns].groupby(rows[by], observed=True)
+    sums = groups.sum()
+    # Rows are distinct projects already, so the group size is the project count.
+    sums.insert(0, "Projects", groups.size())
+    # Plain labels, so sums of versions with different categories line up.
+    sums.index = sums.index.astype(object)
+    return sums.sort_index()
+
+
+def _table(sums):
+    table = sums.drop(columns=["_weight", "_weighted", "_weighing"])
+    # Gated on the count: carried sums may leave a rounding residue where the weight is really 0.
+    table["Weighted Billed %"] = (sums["_weighted"] / sums["_weight"]).where(sums["_weighing"] > 0)
+    return table
+
+
+def _shifted(sums, old_rows, new_rows, by):
+    """``sums`` without the old rows' share and with the new rows'; emptied groups are dropped."""
+    sums = sums.sub(_sums(old_rows, by), fill_value=0).add(_sums(new_rows, by), fill_value=0)
+    counts = {"Projects": "int64", "_weighing": "int64", "Open AR Projects": "int64"}
+    return sums[sums["Projects"] > 0].astype(counts)
+
+
+class PortfolioSummary:
+    """Totals plus Region and Type breakdowns for one data version.
+
+    ``Weighted Billed %`` is the Billed % of each project weighted by its
+    Total PO Amt; ``Open AR Projects`` counts projects with non-zero Open AR.
+    A project listed more than once counts once, with the figures of its first row.
+    """
+
+    def __init__(self, df):
+        self._first = _first_rows(df)
+        rows = _prepare(df[self._first])
+        self._group_sums = {by: _sums(rows, by) for by in GROUPS}
+        self._publish()
+
+    def _publish(self):
+        self.by_region = _table(self._group_sums["Region"])
+        self.by_type = _table(self._group_sums["Type"])
+        totals = _table(self._group_sums["_all"])
+        self.totals = totals.iloc[0] if len(totals) else None
+
+    def updated(self, previous, entry, changes):
+        """Summary for ``entry``: the sums move by the changed projects' old and new first rows."""
+        if not columns_changed(previous, entry, changes, SUMMARY_COLUMNS):
+            return self
+        if changes.rows is not None:
+            # Edits in place keep every row's project, and so which rows come first.
+            first = self._first
+            positions = [pos for pos in changes.rows if first[pos]]
+            old_rows, new_rows = previous.df.iloc[positions], entry.df.iloc[positions]
+        else:
+            first = _first_rows(entry.df)
+            projects = affected(changes)
+            old_rows = previous.df[self._first & previous.df["Project"].isin(projects).to_numpy()]
+            new_rows = entry.df[first & entry.df["Project"].isin(projects).to_numpy()]
+        old_rows, new_rows = _prepare(old_rows), _prepare(new_rows)
+        summary = copy.copy(self)
+        summary._first = first
+        summary._group_sums = {by: _shifted(sums, old_rows, new_rows, by) for by, sums in self._group_sums.items()}
+        summary._publish()
+        return summary
+
+
+def portfolio_summary(entry, previous=None):
+    """Return the ``PortfolioSummary`` for a ``CachedWorkbook``, building it once.
+
+    With the ``previous`` version at hand only the changed projects are re-aggregated.
+    """
+    summary = entry.derived.get("portfolio_summary")
+    if summary is None:
+        changes = changes_since(entry, previous)
+        old = previous.derived.get("portfolio_summary") if changes is not None else None
+        summary = entry.derived["portfolio_summary"] = (
+            old.updated(previous, entry, changes) if old is not None else PortfolioSummary(entry.df)
+        )
+    return summary
@@ -0,0 +1,136 @@
+"""Project page content, independent of Streamlit.
+
+``project_view`` turns one normalized row into the labels, values and HTML
+snippets the project page shows. The Streamlit pages lay it out with
+``st.*`` calls; ``dashboard.report`` writes the same view as static HTML.
+"""
+import re
+
+import pandas as pd
+
+
+# --- Helpers ---
+def get_field(row, name):
+    """Return the value of a canonical column (see dashboard.schema), None if blank."""
+    val = row[name]
+    return val if pd.notna(val) else None
+
+
+def format_num(value):
+    """Return integer string for a normalized amount (including 0). Blank if missing."""
+    if value is None or pd.isna(value):
+        return ""
+    return str(int(round(value, 0)))
+
+
+def color_percent_html(pct):
+    """Return HTML span with color for pct (green>0, red<0, black==0)."""
+    if pct is None:
+        return ""
+    color = "green" if pct > 0 else ("red" if pct < 0 else "black")
+    return f"<span style='color:{color}; font-weight:bold'>{pct}%</span>"
+
+
+def format_date(value):
+    """Format a normalized (datetime) Update Date to DD-MMM-YYYY. Blank if missing."""
+    if value is None or pd.isna(value):
+        return ""
+    return value.strftime("%d-%b-%Y")
+
+
+def format_resource(value):
+    """Resources Deployed may be a head count or free text."""
+    if value is None:
+        return ""
+    try:
+        return str(int(float(value)))
+    except (TypeError, ValueError):
+        return str(value).strip()
+
+
+def break_sentences_to_html(text):
+    """Insert line breaks (<br>) after '|' for markdown with unsafe_html."""
+    if text is None or (isinstance(text, float) and pd.isna(text)):
+        return ""
+    s = str(text).strip()
+    s = re.sub(r'([|])\s+', r'\1\n', s)
+    return s.replace("\n", "<br>")
+
+
+def project_view(row, show_profit=True, show_challenges=True, escape=None):
+    """Everything the project page shows for ``row``, as plain values.
+
+    ``escape`` is applied to every free-text cell before it is embedded; the
+    Streamlit pages pass None (cells may carry markdown), static HTML output
+    passes ``html.escape``.
+
+    Returns a dict with:
+      name, dates, duration   header text
+      metrics                 [(label, value, progress or None)], first row
+      line_items              [(label, value, is_html)], second row
+      billing_milestone       HTML or None
+      sections                [[(heading, HTML), (heading, HTML)], ...] two-column blocks
+      challenges              HTML or None
+      updated_on              footer date text
+    """
+    def text(name):
+        value = get_field(row, name)
+        if value is None or escape is None:
+            return value
+        return escape(str(value))
+
+    def text_html(name):
+        """HTML for a free-text field, or None when the cell is blank (section hidden)."""
+        value = text(name)
+        return break_sentences_to_html(value) if value else None
+
+    billed_pct = get_field(row, "Billed")  # whole percent, see dashboard.normalize
+    open_ar = get_field(row, "Open AR")
+
+    # --- First row (Dynamic layout based on Open AR)
+    metrics = [
+        ("💰 PO Amt (in Lakhs)", f"₹ {format_num(get_field(row, 'Total PO Amt'))}", None),
+        ("📤 Billing Done (in Lakhs)", f"₹ {format_num(get_field(row, 'Billed Till Date'))}", None),
+        ("🧾 Open Billing (in Lakhs)", f"₹ {format_num(get_field(row, 'Open Billing'))}", None),
+    ]
+    if billed_pct is not None:
+        metrics.append(("📊 Billed %", f"{billed_pct}%", max(0, min(100, billed_pct)) / 100.0))
+    else:
+        metrics.append(("📊 Billed %", "N/A", None))
+    if open_ar is not None and open_ar != 0:
+        metrics.append(("💳 Open AR (in Lakhs)", f"₹ {format_num(open_ar)}", None))
+
+    # --- Second row
+    line_items = []
+    if show_profit:
+        profit_ytd = get_field(row, "Profit_YTD MIS")
+        profit_fy = get_field(row, "Profit_FY24-25_MIS")
+        if profit_ytd is not None and profit_ytd != 0:
+            line_items.append(("💹 Profit YTD MIS (%)", color_percent_html(profit_ytd), True))
+        if profit_fy is not None and profit_fy != 0:
+            line_items.append(("📈 Profit FY24-25 MIS (%)", color_percent_html(profit_fy), True))
+
+    line_items.append(("👥 Resources Deployed", format_resource(text("Resource")), False))
+
+    # ⬇ Milestone amount as TEXT (no numeric formatting)
+    milestone_amt = text("Milestone billing amount")
+    milestone_amt = "" if milestone_amt is None else str(milestone_amt).strip()
+    if milestone_amt != "":
+        line_items.append(("💵 Milestone Billing Amount", f"₹ {milestone_amt}", False))
+
+    return {
+        "name": text("Project1") or "",
+        "dates": text("Project Dates") or "",
+        "duration": text("Project Duration") or "",
+        "metrics": metrics,
+        "line_items": line_items,
+        "billing_milestone": text_html("Billing Milestone"),
+        "sections": [
+            [("🔧 Scope", break_sentences_to_html(text("Scope"))),
+             ("📈 Overall Progress", break_sentences_to_html(text("Overall Progress")))],
+            [("🛠️ Technology / Tools", break_sentences_to_html(text("Technology / tools"))),
+             ("📅 Weekly Plan", break_sentences_to_html(text("Weekly Plan")))],
+        ],
+        "challenges": text_html("Challenges / Risks") if show_challenges else None,
+        "updated_on": format_date(get_field(row, "Update Date")),
+    }
@@ -0,0 +1,200 @@
+"""Headless batch report: one static page per project, optionally as PDF.
+
+    python -m dashboard.report -o reports            # HTML for every project
+    python -m dashboard.report -o reports --pdf      # ... plus PDF (needs weasyprint)
+
+Pages are built from the same ``project_view`` the dashboard lays out, and
+are written in parallel across a process pool. The logo and stylesheet are
+written once into the output directory and referenced by every page.
+
+Re-running into the same directory only rewrites pages whose project rows
+changed since the last run (their fingerprints are kept in ``.fingerprints.json``);
+``--force`` rewrites everything.
+"""
+import argparse
+import html
+import json
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from dashboard.changes import project_fingerprints
+from dashboard.index import project_index
+from dashboard.loader import DATA_SOURCE, load_entry
+from dashboard.render import project_view
+
+LOGO_PATH = Path(__file__).resolve().parent.parent / "static" / "logo.png"
+MANIFEST = ".fingerprints.json"
+
+# Mirrors the dashboard's metric/column boxes and its @media print rules.
+REPORT_CSS = """\
+body { font-family: "Source Sans Pro", Arial, sans-serif; margin: 24px; color: #000; background: #fff; }
+.logo { text-align: right; margin: 0 0 10px 0; }
+.logo img { width: 120px; height: auto; }
+.row { display: flex; gap: 12px; margin-bottom: 8px; }
+.row > div { flex: 1; border: 1px solid #ccc; border-radius: 8px; padding: 8px; }
+.metric .label { font-size: 0.85em; }
+.metric .value { font-size: 1.8em; }
+.metric progress { width: 100%; }
+.caption { color: #666; font-size: 0.85em; }
+@media print {
+    .row > div { border: 1px solid #000; border-radius: 4px; padding: 6px; }
+    .caption { color: #000; }
+}
+"""
+
+PAGE_TEMPLATE = """\
+<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<link rel="stylesheet" href="report.css">
+</head>
+<body>
+<div class="logo"><img src="logo.png" alt="Company logo"></div>
+{body}
+</body>
+</html>
+"""
+
+
+def slugify(name, taken):
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", name).strip("-") or "project"
+    candidate, n = slug, 2
+    while candidate in taken:
+        candidate, n = f"{slug}-{n}", n + 1
+    taken.add(candidate)
+    return candidate
+
+
+def render_html(view):
+    """Static HTML body for a ``project_view`` (text already escaped)."""
+    parts = [
+        f"<h3>📌 Project : <strong>{view['name']}</strong></h3>",
+        f"<p><strong>📅 Project Dates</strong>: {view['dates']} &nbsp;&nbsp;&nbsp; "
+        f"<strong>📆 Duration</strong>: {view['duration']}</p>",
+        "<hr>",
+        '<div class="row">',
+    ]
+    for label, value, progress in view["metrics"]:
+        bar = "" if progress is None else f'<progress value="{progress:.2f}" max="1"></progress>'
+        parts.append(f'<div class="metric"><div class="label">{label}</div><div class="value">{value}</div>{bar}</div>')
+    parts.append("</div>")
+
+    parts.append('<div class="row">')
+    for label, value, _is_html in view["line_items"]:
+        parts.append(f"<div><strong>{label}</strong>: {value}</div>")
+    parts.append("</div>")
+
+    if view["billing_milestone"] is not None:
+        parts.append(f"<h6>📅 Billing Milestone</h6><div>{view['billing_milestone']}</div>")
+
+    for pair in view["sections"]:
+        parts.append('<div class="row">')
+        parts.extend(f"<div><h3>{heading}</h3><div>{body}</div></div>" for heading, body in pair)
+        parts.append("</div>")
+
+    if view["challenges"] is not None:
+        parts.append(f"<h3>⚠️ Challenges &amp; Risks</h3><div>{view['challenges']}</div>")
+
+    parts.append(f'<hr><p class="caption">Updated on: {view["updated_on"]}</p>')
+    return PAGE_TEMPLATE.format(title=view["name"], body="\n".join(parts))
+
+
+def _write_page(out_dir, slug, view, pdf):
+    """Worker: write one project's HTML (and PDF); runs in a pool process."""
+    page = Path(out_dir) / f"{slug}.html"
+    page.write_text(render_html(view), encoding="utf-8")
+    if pdf:
+        from weasyprint import HTML
+
+        HTML(filename=str(page), base_url=str(out_dir)).write_pdf(str(page.with_suffix(".pdf")))
+    return page.name
+
+
+def write_assets(out_dir):
+    """Shared assets, written once per run rather than inlined into every page."""
+    shutil.copyfile(LOGO_PATH, out_dir / "logo.png")
+    (out_dir / "report.css").write_text(REPORT_CSS, encoding="utf-8")
+
+
+def write_index(out_dir, pages):
+    links = "\n".join(
+        f'<li><a href="{html.escape(page)}">{html.escape(name)}</a></li>' for name, page in pages
+    )
+    body = f"<h3>📂 Projects</h3>\n<ul>\n{links}\n</ul>"
+    (out_dir / "index.html").write_text(PAGE_TEMPLATE.format(title="Projects", body=body), encoding="utf-8")
+
+
+def build_reports(out_dir, source=DATA_SOURCE, projects=None, pdf=False, workers=None,
+                  show_profit=True, show_challenges=False, force=False):
+    """Write one page per project into ``out_dir``; returns ([(project, file name)], pages rewritten)."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    write_assets(out_dir)
+
+    entry = load_entry(source)
+    index = project_index(entry)
+    fingerprints = project_fingerprints(entry)
+    manifest_path = out_dir / MANIFEST
+    previous = {} if force or not manifest_path.exists() else json.loads(manifest_path.read_text(encoding="utf-8"))
+    layout = f"{show_profit:d}{show_challenges:d}{pdf:d}"
+
+    names = projects or index.projects
+    taken = set()
+    pages, jobs, manifest = {}, [], {}
+    for name in names:
+        row = index.row(name)
+        if row is None:
+            raise SystemExit(f"Unknown project: {name}")
+        slug = slugify(name, taken)
+        manifest[slug] = f"{fingerprints[name]}:{layout}"
+        if previous.get(slug) == manifest[slug] and (out_dir / f"{slug}.html").exists():
+            pages[name] = f"{slug}.html"
+            continue
+        view = project_view(row, show_profit=show_profit, show_challenges=show_challenges, escape=html.escape)
+        jobs.append((name, slug, view))
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_write_page, out_dir, slug, view, pdf) for _, slug, view in jobs]
+            pages.update((name, future.result()) for (name, _, _), future in zip(jobs, futures))
+
+    pages = [(name, pages[name]) for name in names]
+    write_index(out_dir, pages)
+    manifest_path.write_text(json.dumps({**previous, **manifest}, indent=1), encoding="utf-8")
+    return pages, len(jobs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the project dashboard as static HTML/PDF pages.")
+    parser.add_argument("-o", "--output", default="reports", help="output directory (default: reports)")
+    parser.add_argument("--source", default=DATA_SOURCE, help="source spec: workbook path/URL, directory, sheets (see dashboard.loader)")
+    parser.add_argument("--project", action="append", dest="projects", help="only this project (repeatable)")
+    parser.add_argument("--pdf", action="store_true", help="also write a PDF per project (needs weasyprint)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="parallel render processes")
+    parser.add_argument("--pm", action="store_true",
+                        help="PM layout: Challenges / Risks instead of the profit figures")
+    parser.add_argument("--force", action="store_true", help="rewrite pages even if their project is unchanged")
+    args = parser.parse_args(argv)
+
+    if args.pdf:
+        try:
+            import weasyprint  # noqa: F401
+        except ImportError:
+            parser.error("--pdf needs weasyprint (pip install weasyprint)")
+
+    started = time.perf_counter()
+    pages, written = build_reports(args.output, source=args.source, projects=args.projects, pdf=args.pdf,
+                                   workers=args.workers, show_profit=not args.pm, show_challenges=args.pm,
+                                   force=args.force)
+    print(f"Wrote {written} of {len(pages)} project page(s) to {args.output} "
+          f"in {time.perf_counter() - started:.2f}s ({len(pages) - written} unchanged)")
+
+
+if __name__ == "__main__":
+    main()
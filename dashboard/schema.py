@@ -0,0 +1,83 @@
+"""Canonical dashboard columns, their header variants and value types.
+
+This is the one place that knows what the workbook headers may be called.
+``apply_schema`` resolves the variants against ``df.columns`` once at load
+time, so the pages read canonical columns directly.
+
+dtypes:
+  key      stripped string used for lookups and grouping
+  text     free text, may contain '|' separated sentences
+  number   amount in lakhs
+  percent  fraction (0.67) or percent (67 / "67%")
+  date     Excel date, serial or date-like text
+"""
+from collections import namedtuple
+
+import pandas as pd
+
+Field = namedtuple("Field", ["aliases", "dtype"])
+
+SCHEMA = {
+    "Project": Field([], "key"),
+    "Project1": Field([], "key"),
+    "Region": Field([], "key"),
+    "Type": Field([], "key"),
+    "Project Dates": Field(["ProjectDate", "Project_Date"], "text"),
+    "Project Duration": Field(["ProjectDuration", "Duration"], "text"),
+    "Total PO Amt": Field(["Total_PO_Amt"], "number"),
+    "Billed Till Date": Field([], "number"),
+    "Open Billing": Field([], "number"),
+    "Open AR": Field([], "number"),
+    "Billed": Field(["Billed %", "Billed%"], "percent"),
+    "Profit_YTD MIS": Field(["Profit_YTD_MIS"], "percent"),
+    "Profit_FY24-25_MIS": Field(["Profit_FY24-25 MIS"], "percent"),
+    "Resource": Field(["Resource Deployed", "Resources"], "text"),
+    "Milestone billing amount": Field(["MilestoneBillingAmount"], "text"),
+    "Billing Milestone": Field([], "text"),
+    "Scope": Field(["ScopeDetails"], "text"),
+    "Overall Progress": Field(["OverallProgress"], "text"),
+    "Technology / tools": Field(["Technology", "Technology / Tools"], "text"),
+    "Weekly Plan": Field(["WeeklyPlan"], "text"),
+    "Challenges / Risks": Field([], "text"),
+    "Update Date": Field(["Updated On", "Update", "UpdateDate"], "date"),
+}
+
+
+def columns_of(dtype):
+    return [name for name, field in SCHEMA.items() if field.dtype == dtype]
+
+
+def header_names():
+    """Every header the schema reads (canonical names and aliases)."""
+    return {name for canonical, field in SCHEMA.items() for name in [canonical, *field.aliases]}
+
+
+def resolve_columns(columns):
+    """Map each canonical name to the headers present for it, in priority order."""
+    present = set(columns)
+    return {
+        name: [col for col in [name] + field.aliases if col in present]
+        for name, field in SCHEMA.items()
+    }
+
+
+def apply_schema(df):
+    """Collapse header variants into canonical columns (first non-null wins).
+
+    Canonical columns missing from the sheet are added empty so the pages
+    never need to probe ``df.columns``. Columns outside the schema pass
+    through untouched.
+    """
+    for name, found in resolve_columns(df.columns).items():
+        if not found:
+            df[name] = pd.NA
+            continue
+        merged = df[found[0]]
+        for alias in found[1:]:
+            merged = merged.combine_first(df[alias])
+        df = df.drop(columns=[col for col in found if col != name])
+        df[name] = merged
+
+    for col in columns_of("key"):
+        df[col] = df[col].astype(str).str.strip()
+    return df
@@ -0,0 +1,199 @@
+"""Inverted index over the long free-text columns.
+
+Built once per data version (and warmed by the store), so a search is a few
+dictionary lookups instead of a scan of every cell. Text is split into the
+same sentences the page shows (``|`` separators and line breaks), and each
+sentence keeps its terms so snippets don't need a rescan either.
+"""
+import copy
+import html
+import math
+import re
+from bisect import bisect_left
+from collections import defaultdict, deque
+
+import pandas as pd
+
+from dashboard.changes import affected, changes_since, columns_changed
+
+SEARCH_COLUMNS = ["Scope", "Overall Progress", "Weekly Plan", "Challenges / Risks"]
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_SENTENCE_BREAK = re.compile(r"\|\s+|\n")
+SNIPPET_CHARS = 160
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+class SearchIndex:
+    """term -> {row position: term frequency}, plus per-row sentences for snippets."""
+
+    def __init__(self, df):
+        self.projects = df["Project"].tolist()
+        self.postings = defaultdict(dict)
+        self.sentences = []  # per row: [(column, sentence, terms)]
+        for pos, cells in enumerate(zip(*(df[col] for col in SEARCH_COLUMNS))):
+            self.sentences.append(_index_row(pos, cells, self.postings.__getitem__))
+        self.vocabulary = sorted(self.postings)
+
+    def updated(self, previous, entry, changes):
+        """Index for ``entry`` that re-tokenizes only the edited rows.
+
+        Postings shared with the previous version are copied before they are
+        touched, since sessions may still be searching it.
+        """
+        if changes.rows is None:
+            return self._remapped(entry, changes)
+        if not columns_changed(previous, entry, changes, SEARCH_COLUMNS):
+            return self
+        index = copy.copy(self)
+        index.postings = defaultdict(dict, self.postings)
+        index.sentences = list(self.sentences)
+        owned = set()
+
+        def posting(term):
+            if term not in owned:
+                owned.add(term)
+                index.postings[term] = dict(self.postings.get(term, {}))
+            return index.postings[term]
+
+        for pos in changes.rows:
+            for term in {term for _, _, terms in self.sentences[pos] for term in terms}:
+                del posting(term)[pos]
+        for pos, cells in zip(changes.rows, entry.df[SEARCH_COLUMNS].iloc[changes.rows].itertuples(index=False)):
+            index.sentences[pos] = _index_row(pos, cells, posting)
+        for term in owned:
+            if not index.postings[term]:
+                del index.postings[term]
+        if index.postings.keys() != self.postings.keys():
+            index.vocabulary = sorted(index.postings)
+        return index
+
+    def _remapped(self, entry, changes):
+        """Rows were added, removed or moved: new positions, but unchanged rows keep their terms."""
+        skip = affected(changes)
+        old_positions = defaultdict(deque)
+        for pos, project in enumerate(self.projects):
+            if project not in skip:
+                old_positions[project].append(pos)
+
+        index = copy.copy(self)
+        index.projects = entry.df["Project"].tolist()
+        index.postings = defaultdict(dict)
+        index.sentences = []
+        fresh = []
+        for pos, project in enumerate(index.projects):
+            reused = old_positions.get(project)
+            if not reused:
+                fresh.append(pos)
+                index.sentences.append(None)
+                continue
+            old = reused.popleft()
+            index.sentences.append(self.sentences[old])
+            for term in {term for _, _, terms in self.sentences[old] for term in terms}:
+                index.postings[term][pos] = self.postings[term][old]
+        for pos, cells in zip(fresh, entry.df[SEARCH_COLUMNS].iloc[fresh].itertuples(index=False)):
+            index.sentences[pos] = _index_row(pos, cells, index.postings.__getitem__)
+        index.vocabulary = sorted(index.postings)
+        return index
+
+    def _expand(self, term):
+        """Exact term plus vocabulary words starting with it (search-as-you-type)."""
+        start = bisect_left(self.vocabulary, term)
+        matches = []
+        for word in self.vocabulary[start:]:
+            if not word.startswith(term):
+                break
+            matches.append(word)
+        return matches
+
+    def search(self, query, limit=20):
+        """Ranked [(project, score, snippet_html)]; every query term must match."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        rows = len(self.projects)
+        scores = None
+        expanded = []
+        for term in terms:
+            words = self._expand(term)
+            expanded.append(words)
+            term_scores = defaultdict(float)
+            for word in words:
+                postings = self.postings[word]
+                idf = math.log(1 + rows / len(postings))
+                for pos, tf in postings.items():
+                    term_scores[pos] += (1 + math.log(tf)) * idf
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {pos: score + term_scores[pos] for pos, score in scores.items() if pos in term_scores}
+            if not scores:
+                return []
+
+        matched = {word for words in expanded for word in words}
+        best = {}
+        for pos, score in scores.items():
+            project = self.projects[pos]
+            # Equal scores go to the earlier row, whatever order the postings were built in.
+            kept = best.get(project)
+            if kept is None or score > kept[0] or (score == kept[0] and pos < kept[1]):
+                best[project] = (score, pos)
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], item[1][1]))[:limit]
+        return [(project, round(score, 2), self.snippet(pos, matched)) for project, (score, pos) in ranked]
+
+    def snippet(self, pos, matched, sentences=2):
+        """HTML of the best-matching sentences of a row, matches wrapped in <mark>."""
+        hits = sorted(
+            ((len(terms & matched), col, sentence) for col, sentence, terms in self.sentences[pos]),
+            key=lambda hit: -hit[0],
+        )
+        pattern = re.compile(r"\b(" + "|".join(re.escape(w) for w in sorted(matched, key=len, reverse=True)) + r")",
+                             re.IGNORECASE)
+        parts = []
+        for count, col, sentence in hits[:sentences]:
+            if not count:
+                break
+            text = sentence if len(sentence) <= SNIPPET_CHARS else sentence[:SNIPPET_CHARS].rsplit(" ", 1)[0] + " …"
+            # Match the raw text and escape the pieces, so a match can't land inside an entity.
+            pieces = pattern.split(text)
+            marked = "".join(f"<mark>{html.escape(piece)}</mark>" if i % 2 else html.escape(piece)
+                             for i, piece in enumerate(pieces))
+            parts.append(f"<i>{html.escape(col)}</i>: {marked}")
+        return "<br>".join(parts)
+
+
+def _index_row(pos, cells, posting):
+    """Sentences of one row; counts its terms into ``posting(term)[pos]``."""
+    row_sentences = []
+    counts = {}
+    for col, cell in zip(SEARCH_COLUMNS, cells):
+        if cell is None or pd.isna(cell):
+            continue
+        for sentence in _SENTENCE_BREAK.split(str(cell).strip()):
+            terms = tokenize(sentence)
+            if not terms:
+                continue
+            row_sentences.append((col, sentence.strip(), set(terms)))
+            for term in terms:
+                counts[term] = counts.get(term, 0) + 1
+    for term, count in counts.items():
+        posting(term)[pos] = count
+    return row_sentences
+
+
+def search_index(entry, previous=None):
+    """Return the ``SearchIndex`` for a ``CachedWorkbook``, building it once.
+
+    With the ``previous`` version at hand only the edited rows are re-tokenized.
+    """
+    index = entry.derived.get("search_index")
+    if index is None:
+        changes = changes_since(entry, previous)
+        old = previous.derived.get("search_index") if changes is not None else None
+        index = entry.derived["search_index"] = (
+            old.updated(previous, entry, changes) if old is not None else SearchIndex(entry.df)
+        )
+    return index
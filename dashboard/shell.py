@@ -0,0 +1,71 @@
+"""Cold-start shell: what a page can paint before the data layer is loaded.
+
+Every published version leaves a tiny JSON summary (project names plus the
+Region/Type counts) beside the data. A cold process paints the page config,
+logo and a sidebar skeleton from it right away, and only then imports pandas
+and the loader and waits for the workbook. Nothing here imports pandas.
+"""
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+import streamlit as st
+
+log = logging.getLogger(__name__)
+
+SHELL_CACHE = os.environ.get(
+    "DASHBOARD_SHELL_CACHE", str(Path(__file__).resolve().parent.parent / "data" / "shell.json")
+)
+
+# Set once this process has published a version; later runs skip the skeleton.
+_ready = threading.Event()
+
+
+def data_ready():
+    return _ready.is_set()
+
+
+def remember(index):
+    """Save the sidebar summary of a published ``ProjectIndex`` for the next cold start."""
+    _ready.set()
+    summary = {
+        "projects": index.projects,
+        "region_counts": index.region_counts,
+        "type_counts": index.type_counts,
+    }
+    path = Path(SHELL_CACHE)
+    try:
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(summary, ensure_ascii=False, default=int), encoding="utf-8")
+        tmp.replace(path)
+    except OSError as exc:
+        log.info("Could not save the shell summary: %s", exc)
+
+
+def read_shell():
+    """The last saved summary, or None before the first ever load."""
+    try:
+        return json.loads(Path(SHELL_CACHE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def sidebar_skeleton(header, counts=True):
+    """Display-only sidebar from the saved summary; returns a placeholder to clear once data is in."""
+    shell = read_shell()
+    placeholder = st.sidebar.empty()
+    with placeholder.container():
+        st.header(header)
+        if shell is None:
+            st.caption("Loading projects…")
+            return placeholder
+        st.caption(f"Loading {len(shell['projects'])} projects…")
+        if counts:
+            for title, key in (("📍 Region Summary", "region_counts"), ("📁 Type Summary", "type_counts")):
+                st.markdown("---")
+                st.subheader(title)
+                for group, count in sorted(shell[key].items()):
+                    st.markdown(f"<div style='padding:6px;'>{group} ({count})</div>", unsafe_allow_html=True)
+    return placeholder
@@ -0,0 +1,46 @@
+"""Single-flight call coalescing.
+
+When many sessions need the same expensive result at once (a cold start, or
+every session finding the cache expired in the same second), only the first
+caller runs the work; the others wait for it and get its result, or its
+exception, instead of starting their own. Calls for different keys run
+concurrently, and nothing is remembered once a call returns.
+"""
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and hands its outcome to everyone waiting."""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        # Calls run, and calls answered by another caller's call instead.
+        self.runs = 0
+        self.shared = 0
+
+    def do(self, key, fn):
+        """Result of ``fn()``, or of the call already in flight for ``key``."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+                self.runs += 1
+            else:
+                self.shared += 1
+        if not leader:
+            return call.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            call.set_exception(exc)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -0,0 +1,100 @@
+"""Columnar (Parquet) snapshots compiled from the Excel workbook.
+
+openpyxl parsing is the slowest step of a render, so the workbook is compiled
+once into a Parquet file next to it::
+
+    python -m dashboard.snapshot data/Dashboard_data.xlsx
+
+The snapshot records a SHA-256 of the workbook bytes it was built from. The
+loader only trusts a snapshot whose digest matches the current workbook and
+falls back to parsing the XLSX otherwise.
+"""
+import argparse
+import hashlib
+import io
+import time
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+SNAPSHOT_SUFFIX = ".parquet"
+# Bump when cleaning or the schema changes what a snapshot contains.
+FORMAT_VERSION = "4"
+FORMAT_KEY = b"dashboard.format"
+DIGEST_KEY = b"dashboard.source_sha256"
+SOURCE_KEY = b"dashboard.source"
+BUILT_KEY = b"dashboard.built_at"
+
+
+def source_digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def snapshot_location(source):
+    """Snapshot sits beside the workbook: same name, ``.parquet`` suffix (path or URL)."""
+    source = str(source)
+    stem, dot, ext = source.rpartition(".")
+    if not dot or "/" in ext:
+        return source + SNAPSHOT_SUFFIX
+    return stem + SNAPSHOT_SUFFIX
+
+
+def read_snapshot(snapshot, expected_digest):
+    """Return the snapshot as a DataFrame, or None if it is missing or stale.
+
+    ``snapshot`` is a local path (read memory-mapped) or the raw bytes of a
+    downloaded snapshot.
+    """
+    if isinstance(snapshot, (bytes, bytearray)):
+        snapshot = pa.BufferReader(snapshot)
+    elif not Path(snapshot).exists():
+        return None
+    parquet = pq.ParquetFile(snapshot, memory_map=True)
+    metadata = parquet.schema_arrow.metadata or {}
+    if metadata.get(FORMAT_KEY, b"").decode() != FORMAT_VERSION:
+        return None
+    if metadata.get(DIGEST_KEY, b"").decode() != expected_digest:
+        return None
+    return parquet.read().to_pandas()
+
+
+def write_snapshot(df, dest, digest, source=""):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata.update({
+        FORMAT_KEY: FORMAT_VERSION.encode(),
+        DIGEST_KEY: digest.encode(),
+        SOURCE_KEY: str(source).encode(),
+        BUILT_KEY: time.strftime("%Y-%m-%dT%H:%M:%S").encode(),
+    })
+    pq.write_table(table.replace_schema_metadata(metadata), dest)
+
+
+def build_snapshot(source, dest=None):
+    """Compile the first sheet of ``source`` (XLSX path) into a snapshot and return its path."""
+    from dashboard.workbook import read_workbook
+
+    data = Path(source).read_bytes()
+    df = read_workbook(io.BytesIO(data))
+    dest = dest or snapshot_location(source)
+    write_snapshot(df, dest, source_digest(data), source=Path(source).name)
+    return dest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile dashboard workbooks into Parquet snapshots.")
+    parser.add_argument("sources", nargs="+", help="XLSX workbooks to compile")
+    parser.add_argument("-o", "--output", help="snapshot path (single source only)")
+    args = parser.parse_args(argv)
+    if args.output and len(args.sources) > 1:
+        parser.error("--output can only be used with a single source")
+
+    for source in args.sources:
+        started = time.perf_counter()
+        dest = build_snapshot(source, args.output)
+        print(f"{source} -> {dest} ({time.perf_counter() - started:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Process-wide data store refreshed off the request path.
+
+A daemon thread revalidates remote sources every ``interval`` seconds (local
+files are watched instead, see ``dashboard.watch``), builds the derived
+indexes for a new version, and only then publishes it. Publishing is
+a single attribute assignment, so a rerun always reads a complete, already
+built version and never waits on the network; only the very first load of a
+cold process happens in the caller. New versions are derived from the one
+they replace, so a refresh rebuilds only what the changed rows affect, and
+are recorded in the dated history (``dashboard.history``) as they are published.
+
+If the source can't be reached on a cold start, the bundled workbook
+(``FALLBACK_SOURCE``) is served until a refresh succeeds.
+"""
+import logging
+import threading
+
+import requests
+
+from dashboard.changes import changes_since, project_fingerprints
+from dashboard.compact import footprint
+from dashboard.compare import comparison_frame
+from dashboard.facets import facet_index
+from dashboard.history import record_version
+from dashboard.index import project_index
+from dashboard.loader import DATA_SOURCE, DEFAULT_TTL, FALLBACK_SOURCE, load_entry, split_sources
+from dashboard.portfolio import portfolio_summary
+from dashboard.search import search_index
+from dashboard.shell import remember
+from dashboard.timing import timed
+from dashboard.watch import watch
+
+log = logging.getLogger(__name__)
+
+
+def warm(entry, previous=None):
+    """Build everything the pages derive from a version before it is published."""
+    with timed("warm"):
+        project_index(entry, previous)
+        portfolio_summary(entry, previous)
+        search_index(entry, previous)
+        facet_index(entry)
+        comparison_frame(entry)
+        project_fingerprints(entry)  # keys the rendered-view cache (dashboard.fragments)
+    log.info("Version %s holds %d rows in %.1f MiB", entry.version, len(entry.df),
+             footprint(entry)["total"] / 2**20)
+    changes = changes_since(entry, previous)
+    if changes is not None:
+        log.info("Version %s: %d added, %d removed, %d changed project(s)", entry.version,
+                 len(changes.added), len(changes.removed), len(changes.changed))
+    return entry
+
+
+class DataStore:
+    """Holds the current ``CachedWorkbook`` for one source."""
+
+    def __init__(self, source=DATA_SOURCE, interval=DEFAULT_TTL, fallback=FALLBACK_SOURCE):
+        self.source = source
+        self.interval = interval
+        self.fallback = fallback
+        self._entry = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._watcher = None
+
+    def current(self):
+        """Return the published version, loading synchronously only on a cold start."""
+        entry = self._entry
+        if entry is None:
+            with self._lock:
+                if self._entry is None:
+                    self._entry = self._publish(self._load_cold(), None)
+                entry = self._entry
+        return entry
+
+    def _load_cold(self):
+        try:
+            return load_entry(self.source, ttl=0)
+        except (requests.RequestException, OSError) as exc:
+            if not self.fallback or self.fallback == self.source:
+                raise
+            log.warning("Could not load %s (%s); serving %s until it is reachable", self.source, exc, self.fallback)
+            return load_entry(self.fallback, ttl=0)
+
+    def refresh(self):
+        """Revalidate the source and publish a new version if it changed."""
+        with self._lock:
+            entry = load_entry(self.source, ttl=0)
+            if entry is not self._entry:
+                self._entry = self._publish(entry, self._entry)
+                log.info("Published %s version %s", self.source, entry.version)
+        return entry
+
+    def _refresh_logged(self):
+        try:
+            self.refresh()
+        except Exception:
+            log.exception("Background refresh of %s failed; keeping current version", self.source)
+
+    @staticmethod
+    def _publish(entry, previous):
+        warm(entry, previous)
+        record_version(entry)
+        remember(project_index(entry))
+        return entry
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._refresh_logged()
+
+    def start(self):
+        """Watch local parts of the source; poll the rest (or everything, if watching fails)."""
+        if self._thread is None and self._watcher is None:
+            urls, paths = split_sources(self.source)
+            if paths:
+                self._watcher = watch(paths, self._refresh_logged)
+            if urls or self._watcher is None:
+                self._thread = threading.Thread(target=self._run, name="dashboard-refresh", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.stop()
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(source=DATA_SOURCE):
+    """Return the shared, started ``DataStore`` for ``source``."""
+    store = _stores.get(source)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(source)
+            if store is None:
+                store = _stores[source] = DataStore(source).start()
+    return store
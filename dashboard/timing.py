@@ -0,0 +1,138 @@
+"""Per-stage latency instrumentation.
+
+Stages recorded by the data layer (fetch, parse, normalize) use ``timed``;
+page scripts time their own stages (load, sidebar, filter, render) with
+``start_run()`` and ``Run.lap``; ``Run.mark`` records milestones such as
+``first_paint`` (run start until the page shell is on screen). Every sample
+goes to a bounded in-process window for percentiles and is logged as one
+JSON line on the ``dashboard.timing`` logger. Every ``SUMMARY_INTERVAL``
+seconds the window's percentiles (``summary()``) are logged as well, so each
+process (the Streamlit server as much as ``dashboard.api``, which also serves
+them at ``/metrics``) reports its own.
+"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+log = logging.getLogger(__name__)
+
+# Samples kept per stage for percentiles.
+WINDOW = 1000
+PERCENTILES = [50, 90, 99]
+# Seconds between logged summaries; 0 turns them off.
+SUMMARY_INTERVAL = float(os.environ.get("DASHBOARD_METRICS_INTERVAL", "60"))
+
+_samples = defaultdict(lambda: deque(maxlen=WINDOW))
+_lock = threading.Lock()
+_reporter = None
+_recorded = 0
+
+
+def record(stage, ms, **fields):
+    global _recorded
+    with _lock:
+        _samples[stage].append(ms)
+        _recorded += 1
+        if _reporter is None and SUMMARY_INTERVAL > 0:
+            _start_reporter()
+    log.info(json.dumps({"stage": stage, "ms": round(ms, 3), **fields}))
+
+
+def _start_reporter():
+    global _reporter
+    _reporter = threading.Thread(target=_report, name="dashboard-metrics", daemon=True)
+    _reporter.start()
+
+
+def _report():
+    reported = 0
+    while True:
+        time.sleep(SUMMARY_INTERVAL)
+        # Nothing new since the last summary: an idle process stays quiet.
+        if _recorded != reported:
+            reported = _recorded
+            log.info(json.dumps({"summary": summary()}))
+
+
+@contextmanager
+def timed(stage):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, (time.perf_counter() - started) * 1000)
+
+
+class Run:
+    """Stage timings for one script run; ``lap`` closes the stage that just ran."""
+
+    def __init__(self, page):
+        self.page = page
+        self.stages = {}
+        self._started = self._last = time.perf_counter()
+
+    def lap(self, stage):
+        now = time.perf_counter()
+        ms = (now - self._last) * 1000
+        self._last = now
+        self.stages[stage] = self.stages.get(stage, 0.0) + ms
+        record(stage, ms, page=self.page)
+        return ms
+
+    def mark(self, stage):
+        """Record the time since the run started under ``stage``, once per run (e.g. first paint)."""
+        if stage not in self.stages:
+            self.stages[stage] = (time.perf_counter() - self._started) * 1000
+            record(stage, self.stages[stage], page=self.page)
+        return self.stages[stage]
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process so far in MiB, or None where it can't be read."""
+    # Linux: VmHWM, because ru_maxrss carries over the parent's peak across fork + exec.
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def start_run(page):
+    return Run(page)
+
+
+def _percentile(ordered, q):
+    return ordered[min(len(ordered) - 1, round(q / 100 * (len(ordered) - 1)))]
+
+
+def summary():
+    """{stage: {count, p50, p90, p99, max}} in milliseconds over the recent window."""
+    with _lock:
+        windows = {stage: sorted(samples) for stage, samples in _samples.items() if samples}
+    return {
+        stage: {
+            "count": len(ordered),
+            **{f"p{q}": round(_percentile(ordered, q), 3) for q in PERCENTILES},
+            "max": round(ordered[-1], 3),
+        }
+        for stage, ordered in windows.items()
+    }
+
+
+def reset():
+    with _lock:
+        _samples.clear()
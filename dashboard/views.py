@@ -0,0 +1,329 @@
+"""The project pages, as functions over the shared data store and renderer.
+
+``streamlit_app.py`` and ``pm_dashboard.py`` (and the portfolio, PM and
+comparison pages of the multipage app) are thin wrappers around
+``dashboard_page``, ``pm_page``, ``portfolio_page`` and ``compare_page``;
+the project pages read the one process-wide ``DataStore`` and lay out the same
+``project_view`` with ``render_project``, so they can't drift apart and a
+multipage deployment keeps one parsed copy of the data and one set of caches.
+
+Only Streamlit and light modules are imported up front. pandas and the data
+layer are imported inside the functions that need them, so a cold process
+paints the page shell (see dashboard.shell) before paying for them.
+"""
+import streamlit as st
+
+from dashboard.assets import emit_head
+from dashboard.debug import timing_panel
+from dashboard.shell import data_ready, sidebar_skeleton
+from dashboard.timing import start_run
+
+PLACEHOLDER = "-- Select Project --"
+
+
+def load_dataset():
+    """Published ``CachedWorkbook`` and its ``ProjectIndex``; the frame is shared, don't mutate it."""
+    from dashboard import loader
+    from dashboard.index import project_index
+    from dashboard.store import get_store
+
+    dataset = get_store(loader.DATA_SOURCE).current()
+    return dataset, project_index(dataset)
+
+
+def load_with_shell(run, header, counts=True):
+    """``load_dataset``, painting a sidebar skeleton first when this process has no data yet."""
+    if data_ready():
+        return load_dataset()
+    skeleton = sidebar_skeleton(header, counts)
+    run.mark("first_paint")
+    with st.spinner("Loading project data…"):
+        loaded = load_dataset()
+    skeleton.empty()
+    return loaded
+
+
+# --- Sidebar ---
+def _select_project(name):
+    st.session_state.selected_project = name
+
+
+def search_sidebar(dataset):
+    """Search across Scope / Progress / Weekly Plan / Risks; a hit selects its project."""
+    query = st.sidebar.text_input("🔍 Search projects", placeholder="e.g. VAPT, payment pending")
+    if not query.strip():
+        return
+    from dashboard.search import search_index
+
+    results = search_index(dataset).search(query, limit=10)
+    if not results:
+        st.sidebar.caption("No matching projects.")
+    for name, score, snippet in results:
+        st.sidebar.button(f"{name}  ·  {score}", key=f"search_{name}", on_click=_select_project, args=(name,),
+                          use_container_width=True)
+        st.sidebar.markdown(f"<div style='font-size:0.8em; padding:0 6px 6px;'>{snippet}</div>",
+                            unsafe_allow_html=True)
+
+
+FACET_TITLES = {
+    "Region": "📍 Region",
+    "Type": "📁 Type",
+    "Billed %": "📊 Billed %",
+    "Open AR status": "💳 Open AR",
+}
+
+
+def _keep_state(key, default):
+    """Re-assert a widget's value: its id (and so its state) changes whenever its options or labels do."""
+    st.session_state[key] = st.session_state.get(key, default)
+
+
+def facet_filters(dataset):
+    """Region / Type / Billed % / Open AR multiselects; returns the projects matching all of them.
+
+    Counts next to each option follow the other filters (see dashboard.facets).
+    """
+    from dashboard.facets import facet_index
+
+    facets = facet_index(dataset)
+    selected = {}
+    for facet in facets.options:
+        key = f"facet_{facet}"
+        # Values of the previous data version that are gone now are dropped.
+        st.session_state[key] = [value for value in st.session_state.get(key, []) if value in facets.bitmaps[facet]]
+        selected[facet] = st.session_state[key]
+    counts = facets.counts(selected)
+
+    st.sidebar.markdown("---")
+    st.sidebar.subheader("🔎 Filter Projects")
+    for facet, options in facets.options.items():
+        st.sidebar.multiselect(FACET_TITLES[facet], options, key=f"facet_{facet}",
+                               format_func=lambda value, facet=facet: f"{value} ({counts[facet][value]})")
+    return facets.matching(selected)
+
+
+def navigation_sidebar(dataset, index):
+    """Search, faceted filters and the project dropdown; returns the selected project or None."""
+    st.sidebar.header("📂 Project Navigation")
+    search_sidebar(dataset)
+    projects = facet_filters(dataset)
+
+    _keep_state("selected_project", PLACEHOLDER)
+    selected = st.session_state.selected_project
+    matching = len(projects)
+    if selected != PLACEHOLDER and selected not in projects:
+        if index.row(selected) is None:
+            st.session_state.selected_project = PLACEHOLDER
+        else:
+            # Picked from search, or before the filters changed: keep it listed.
+            projects = [selected, *projects]
+    st.sidebar.markdown("---")
+    st.sidebar.selectbox("Select Project", [PLACEHOLDER] + projects, key="selected_project")
+    st.sidebar.caption(f"{matching} of {len(index.projects)} projects match the filters")
+    selected = st.session_state.selected_project
+    return None if selected == PLACEHOLDER else selected
+
+
+# --- Project layout ---
+def render_project(view, project):
+    """Lay out a ``project_view`` (see dashboard.render), then the project's trend."""
+    st.markdown(f"### 📌 Project : **{view['name']}**")
+    st.markdown(f"**📅 Project Dates**: {view['dates']} &nbsp;&nbsp;&nbsp; **📆 Duration**: {view['duration']}")
+    st.markdown("---")
+
+    # --- First row (Dynamic layout based on Open AR)
+    cols = st.columns(len(view["metrics"]))
+    for col, (label, value, progress) in zip(cols, view["metrics"]):
+        col.metric(label, value)
+        if progress is not None:
+            col.progress(progress)
+
+    # --- Second row (profit figures only when the view has them)
+    line_items = view["line_items"]
+    cols = st.columns(len(line_items)) if line_items else st.columns(1)
+    for col, (label, val, is_html) in zip(cols, line_items):
+        col.markdown(f"**{label}**: {val}", unsafe_allow_html=is_html)
+
+    # --- Billing Milestone (Full width for multi-line text)
+    if view["billing_milestone"] is not None:
+        st.markdown("###### 📅 Billing Milestone")
+        st.markdown(view["billing_milestone"], unsafe_allow_html=True)
+
+    # --- Scope / Overall Progress, Tech / Weekly Plan
+    for pair in view["sections"]:
+        for col, (heading, html) in zip(st.columns(2), pair):
+            col.markdown(f"### {heading}")
+            col.markdown(html, unsafe_allow_html=True)
+
+    # --- Challenges & Risks
+    if view["challenges"] is not None:
+        st.markdown("### ⚠️ Challenges & Risks")
+        st.markdown(view["challenges"], unsafe_allow_html=True)
+
+    # --- Trend across past loads (see dashboard.history)
+    from dashboard.history import project_trend
+
+    trend = project_trend(project)
+    if len(trend) > 1:
+        st.markdown("### 📉 Trend")
+        left, right = st.columns(2)
+        left.line_chart(trend[["Billed"]].astype("float64"), y_label="Billed %")
+        right.line_chart(trend[["Open Billing", "Open AR"]], y_label="₹ in Lakhs")
+
+    # --- Footer
+    st.markdown("---")
+    st.caption("Updated on: " + view["updated_on"])
+
+
+# --- Pages ---
+def dashboard_page():
+    """Full dashboard: search, faceted Region/Type/Billed %/Open AR filters, profit figures."""
+    st.set_page_config(page_title="Project Dashboard", layout="wide")
+    run = start_run("streamlit_app")
+    emit_head("dashboard.css")
+    run.lap("assets")
+
+    dataset, index = load_with_shell(run, "📂 Project Navigation")
+    run.lap("load")
+
+    selected = navigation_sidebar(dataset, index)
+    run.lap("sidebar")
+    run.mark("first_paint")
+    if selected is None:
+        st.info("Please select a project from sidebar.")
+        st.stop()
+    if index.row(selected) is None:
+        st.warning("Project not found.")
+        st.stop()
+    run.lap("filter")
+
+    from dashboard.fragments import cached_view
+
+    render_project(cached_view(dataset, selected, show_profit=True, show_challenges=False), selected)
+    run.lap("render")
+    timing_panel(run, dataset)
+
+
+def pm_page():
+    """PM view: plain project dropdown, Challenges / Risks instead of profit figures."""
+    st.set_page_config(page_title="PM Project Dashboard", layout="wide")
+    run = start_run("pm_dashboard")
+    emit_head()
+    run.lap("assets")
+
+    dataset, index = load_with_shell(run, "🔍 Select Project", counts=False)
+    run.lap("load")
+
+    st.sidebar.header("🔍 Select Project")
+    selected = st.sidebar.selectbox("Project", index.projects)
+    run.lap("sidebar")
+    run.mark("first_paint")
+    if index.row(selected) is None:
+        st.warning("No projects match your selection.")
+        st.stop()
+    run.lap("filter")
+
+    from dashboard.fragments import cached_view
+
+    render_project(cached_view(dataset, selected, show_profit=False, show_challenges=True), selected)
+    run.lap("render")
+    timing_panel(run, dataset)
+
+
+# Amounts in lakhs, rounded like the project page; every column sorts on click.
+COMPARE_COLUMN_CONFIG = {
+    "PO Amt": st.column_config.NumberColumn("PO Amt (in Lakhs)", format="₹ %.0f"),
+    "Billing Done": st.column_config.NumberColumn("Billing Done (in Lakhs)", format="₹ %.0f"),
+    "Open Billing": st.column_config.NumberColumn("Open Billing (in Lakhs)", format="₹ %.0f"),
+    "Billed %": st.column_config.ProgressColumn(format="%d%%", min_value=0, max_value=100),
+    "Open AR": st.column_config.NumberColumn("Open AR (in Lakhs)", format="₹ %.0f"),
+    "Profit YTD %": st.column_config.NumberColumn("Profit YTD MIS (%)", format="%d%%"),
+}
+
+
+def compare_page():
+    """Comparison: several projects' figures side by side in one sortable table."""
+    st.set_page_config(page_title="Compare Projects", layout="wide")
+    run = start_run("compare")
+    emit_head()
+    run.lap("assets")
+
+    dataset, index = load_with_shell(run, "⚖️ Compare Projects", counts=False)
+    run.lap("load")
+
+    st.sidebar.header("⚖️ Compare Projects")
+    # Start from the project open on the dashboard; drop projects this version no longer has.
+    chosen = st.session_state.get("compare_projects", [st.session_state.get("selected_project")])
+    st.session_state.compare_projects = [project for project in chosen if project in index.positions]
+    chosen = st.sidebar.multiselect("Projects", index.projects, key="compare_projects")
+    run.lap("sidebar")
+    run.mark("first_paint")
+
+    st.markdown("### ⚖️ Project Comparison")
+    if not chosen:
+        st.info("Please select projects to compare from sidebar.")
+        st.stop()
+
+    from dashboard.compare import comparison
+
+    table = comparison(dataset, chosen)
+    run.lap("filter")
+    st.dataframe(table, column_config=COMPARE_COLUMN_CONFIG, use_container_width=True)
+    st.caption("Click a column header to sort.")
+    run.lap("render")
+    timing_panel(run, dataset)
+
+
+# Amounts in lakhs, rounded like the project page.
+PORTFOLIO_COLUMN_CONFIG = {
+    "Projects": st.column_config.NumberColumn(format="%d"),
+    "Total PO Amt": st.column_config.NumberColumn("PO Amt", format="₹ %.0f"),
+    "Billed Till Date": st.column_config.NumberColumn("Billing Done", format="₹ %.0f"),
+    "Open Billing": st.column_config.NumberColumn(format="₹ %.0f"),
+    "Open AR": st.column_config.NumberColumn(format="₹ %.0f"),
+    "Open AR Projects": st.column_config.NumberColumn(format="%d"),
+    "Weighted Billed %": st.column_config.ProgressColumn(format="%.0f%%", min_value=0, max_value=100),
+}
+
+
+def portfolio_page():
+    """Portfolio overview: totals plus Region and Type breakdowns, aggregated once per data version."""
+    st.set_page_config(page_title="Portfolio Overview", layout="wide")
+    run = start_run("portfolio")
+    emit_head()
+    run.lap("assets")
+
+    st.markdown("### 📊 Portfolio Overview")
+    st.markdown("---")
+    run.mark("first_paint")
+    with st.spinner("Loading project data…"):
+        dataset, _ = load_dataset()
+    run.lap("load")
+
+    import pandas as pd
+
+    from dashboard.portfolio import portfolio_summary
+    from dashboard.render import format_num
+
+    summary = portfolio_summary(dataset)
+    if summary.totals is None:
+        st.info("No projects in the workbook yet.")
+        st.stop()
+
+    totals = summary.totals
+    cols = st.columns(6)
+    cols[0].metric("🗂️ Projects", int(totals["Projects"]))
+    cols[1].metric("💰 PO Amt (in Lakhs)", f"₹ {format_num(totals['Total PO Amt'])}")
+    cols[2].metric("📤 Billing Done (in Lakhs)", f"₹ {format_num(totals['Billed Till Date'])}")
+    cols[3].metric("🧾 Open Billing (in Lakhs)", f"₹ {format_num(totals['Open Billing'])}")
+    cols[4].metric("💳 Open AR (in Lakhs)", f"₹ {format_num(totals['Open AR'])}")
+    weighted_billed = totals["Weighted Billed %"]
+    cols[5].metric("📊 Weighted Billed %", "N/A" if pd.isna(weighted_billed) else f"{weighted_billed:.0f}%")
+    st.caption(f"{int(totals['Open AR Projects'])} project(s) with open AR")
+
+    st.markdown("### 📍 By Region")
+    st.dataframe(summary.by_region, column_config=PORTFOLIO_COLUMN_CONFIG, use_container_width=True)
+    st.markdown("### 📁 By Type")
+    st.dataframe(summary.by_type, column_config=PORTFOLIO_COLUMN_CONFIG, use_container_width=True)
+    run.lap("render")
+    timing_panel(run, dataset)
@@ -0,0 +1,77 @@
+"""Revalidate local workbooks as soon as they change on disk.
+
+A watchdog observer watches the directories holding the local parts of a
+source spec, instead of the store polling them. A save usually arrives as a
+burst of events (temporary files, renames), so they are debounced into one
+callback; revalidation still checks modification time and digest, so a
+spurious event costs a ``stat`` rather than a parse.
+"""
+import logging
+import threading
+from pathlib import Path
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+log = logging.getLogger(__name__)
+
+# Seconds of quiet after the last event before the callback runs.
+DEBOUNCE = 1.0
+# Reads (opened / closed without writing) must not trigger a reload.
+CHANGE_EVENTS = {"created", "modified", "moved", "deleted", "closed"}
+
+
+class SourceWatcher(FileSystemEventHandler):
+    """Calls ``on_change`` once the watched files (or ``*.xlsx`` in watched directories) settle."""
+
+    def __init__(self, paths, on_change, debounce=DEBOUNCE):
+        self.files = set()
+        self.dirs = set()
+        for path in paths:
+            path = Path(path).resolve()
+            (self.dirs if path.is_dir() else self.files).add(path)
+        self.on_change = on_change
+        self.debounce = debounce
+        self._timer = None
+        self._lock = threading.Lock()
+        self._observer = Observer()
+        self._observer.daemon = True
+
+    def _relevant(self, path):
+        path = Path(path)
+        if path in self.files:
+            return True
+        return path.parent in self.dirs and path.suffix == ".xlsx" and not path.name.startswith("~$")
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in CHANGE_EVENTS:
+            return
+        if any(path and self._relevant(path) for path in (event.src_path, getattr(event, "dest_path", ""))):
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = threading.Timer(self.debounce, self.on_change)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def start(self):
+        for directory in self.dirs | {path.parent for path in self.files}:
+            self._observer.schedule(self, str(directory), recursive=False)
+        self._observer.start()
+        return self
+
+    def stop(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+        self._observer.stop()
+
+
+def watch(paths, on_change):
+    """Started ``SourceWatcher`` for ``paths``, or None if the platform can't watch them."""
+    try:
+        return SourceWatcher(paths, on_change).start()
+    except OSError as exc:
+        # e.g. inotify watch limit reached or a missing directory; the store polls instead.
+        log.warning("Not watching %s: %s", ", ".join(map(str, paths)), exc)
+        return None
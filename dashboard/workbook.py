@@ -0,0 +1,83 @@
+"""Parse Dashboard_data.xlsx into the cleaned frame every page works from.
+
+Workbooks are read by the streaming reader in dashboard.xlsx, keeping only
+the columns the schema knows; ``DASHBOARD_XLSX_ENGINE=openpyxl`` switches
+back to ``pd.read_excel`` (every column), which is also the fallback if the
+streaming reader can't handle a file. Each parse logs its engine, rows per
+second and the process's peak RSS with the ``parse`` timing.
+"""
+import datetime
+import logging
+import os
+import time
+import zipfile
+from xml.etree.ElementTree import ParseError
+
+import pandas as pd
+
+from dashboard.normalize import normalize
+from dashboard.schema import apply_schema, header_names
+from dashboard.timing import peak_rss_mb, record, timed
+from dashboard.xlsx import read_xlsx
+
+log = logging.getLogger(__name__)
+
+XLSX_ENGINE = os.environ.get("DASHBOARD_XLSX_ENGINE", "stream")
+
+
+def _coerce_mixed(series):
+    """Give mixed-type object columns one type so they round-trip through Arrow."""
+    values = series.dropna()
+    if values.empty:
+        return series
+    is_str = values.map(lambda v: isinstance(v, str))
+    if is_str.all():
+        return series
+    if is_str.any():
+        # Text column with stray numbers; a bare 0 is the sheet's "nothing here" placeholder.
+        return series.map(
+            lambda v: v if isinstance(v, str) or pd.isna(v) else (None if v == 0 else str(v))
+        )
+    is_date = values.map(lambda v: isinstance(v, (datetime.date, datetime.datetime)))
+    if is_date.any():
+        # Date column with stray time-only cells (Excel 0 shown as 00:00) -> NaT.
+        return pd.to_datetime(series.where(series.map(lambda v: isinstance(v, datetime.date))), errors="coerce")
+    return series
+
+
+def clean_frame(df):
+    """Strip headers, make columns Arrow-safe, apply the schema and normalize types."""
+    with timed("normalize"):
+        df.columns = df.columns.str.strip()
+        for col in df.columns[df.dtypes == object]:
+            df[col] = _coerce_mixed(df[col])
+        return normalize(apply_schema(df))
+
+
+def _read_stream(data, sheet_name):
+    if isinstance(data, str) and data.startswith(("http://", "https://")):
+        return None
+    try:
+        return read_xlsx(data, sheet_name, columns=header_names())
+    except (zipfile.BadZipFile, ParseError, KeyError, IndexError) as exc:
+        log.warning("Streaming reader failed (%s), falling back to openpyxl", exc)
+        if hasattr(data, "seek"):
+            data.seek(0)
+        return None
+
+
+def read_workbook(data, sheet_name=0, engine=None):
+    """Parse a path, URL or file-like XLSX into a cleaned DataFrame.
+
+    ``engine`` is ``"stream"`` or ``"openpyxl"`` (default ``XLSX_ENGINE``).
+    """
+    engine = engine or XLSX_ENGINE
+    started = time.perf_counter()
+    df = _read_stream(data, sheet_name) if engine == "stream" else None
+    if df is None:
+        engine = "openpyxl"
+        df = pd.read_excel(data, sheet_name=sheet_name)
+    seconds = time.perf_counter() - started
+    record("parse", seconds * 1000, engine=engine, rows=len(df),
+           rows_per_s=round(len(df) / seconds) if seconds else None, peak_rss_mb=peak_rss_mb())
+    return clean_frame(df)
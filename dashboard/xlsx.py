@@ -0,0 +1,200 @@
+"""Streaming XLSX reader: sheet XML straight into row buffers.
+
+``pd.read_excel`` loads the workbook through openpyxl, which builds a cell
+object (value, style, coordinate) for every cell of the sheet before pandas
+sees a single row. This reader walks the sheet XML with ``iterparse`` and
+keeps only the cells of the requested columns, converted the way pandas'
+openpyxl reader converts them; styles are read just far enough to know which
+number formats are dates. The rows then go through the same ``TextParser``
+as ``read_excel``, so dtypes and NA handling match it exactly.
+"""
+import posixpath
+import zipfile
+from xml.etree.ElementTree import iterparse, parse
+
+import numpy as np
+import pandas as pd
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+from openpyxl.utils.cell import column_index_from_string
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_ISO8601, from_excel
+from pandas.io.parsers import TextParser
+
+MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+WORKSHEET_REL = "/worksheet"
+
+ROW, CELL, VALUE, INLINE, TEXT, RUN = (MAIN + tag for tag in ("row", "c", "v", "is", "t", "r"))
+DIGITS = "0123456789"
+
+
+def _text(node):
+    """Plain text of a shared or inline string (runs joined, phonetic hints dropped)."""
+    parts = [node.findtext(TEXT) or ""]
+    parts.extend(run.findtext(TEXT) or "" for run in node.iter(RUN))
+    return "".join(parts).replace("x005F_", "")
+
+
+def _shared_strings(archive, path):
+    if path not in archive.namelist():
+        return []
+    strings = []
+    with archive.open(path) as src:
+        for _, node in iterparse(src):
+            if node.tag == MAIN + "si":
+                strings.append(_text(node))
+                node.clear()
+    return strings
+
+
+def _date_styles(archive, path):
+    """``(date_styles, timedelta_styles)``: cell style indices with date/duration number formats."""
+    if path not in archive.namelist():
+        return set(), set()
+    with archive.open(path) as src:
+        root = parse(src).getroot()
+    custom = {int(fmt.get("numFmtId")): fmt.get("formatCode")
+              for fmt in root.iterfind(f"{MAIN}numFmts/{MAIN}numFmt")}
+    dates, durations = set(), set()
+    for idx, xf in enumerate(root.iterfind(f"{MAIN}cellXfs/{MAIN}xf")):
+        fmt_id = int(xf.get("numFmtId", 0))
+        fmt = custom.get(fmt_id) or BUILTIN_FORMATS.get(fmt_id)
+        if fmt and is_date_format(fmt):
+            dates.add(idx)
+            if is_timedelta_format(fmt):
+                durations.add(idx)
+    return dates, durations
+
+
+def _sheet_path(archive, sheet_name):
+    """Archive path of the worksheet named ``sheet_name`` (or at that position), and the epoch."""
+    with archive.open("xl/workbook.xml") as src:
+        book = parse(src).getroot()
+    with archive.open("xl/_rels/workbook.xml.rels") as src:
+        rels = {
+            rel.get("Id"): rel.get("Target")
+            for _, rel in iterparse(src)
+            if rel.tag == PKG_REL + "Relationship" and rel.get("Type", "").endswith(WORKSHEET_REL)
+        }
+    props = book.find(MAIN + "workbookPr")
+    epoch = CALENDAR_MAC_1904 if props is not None and props.get("date1904") in ("1", "true") else CALENDAR_WINDOWS_1900
+    sheets = [(sheet.get("name"), rels[sheet.get(REL + "id")])
+              for sheet in book.iterfind(f"{MAIN}sheets/{MAIN}sheet") if sheet.get(REL + "id") in rels]
+    if isinstance(sheet_name, int):
+        if not 0 <= sheet_name < len(sheets):
+            raise ValueError(f"Worksheet index {sheet_name} is invalid, {len(sheets)} worksheets found")
+        target = sheets[sheet_name][1]
+    else:
+        target = dict(sheets).get(sheet_name)
+        if target is None:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+    target = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join("xl", target))
+    return target, epoch
+
+
+def _wanted_columns(header, columns):
+    """Sheet column -> output position for the first header cell matching each wanted (stripped) name."""
+    keep, seen = {}, set()
+    for col in sorted(header):
+        name = str(header[col]).strip()
+        if name in columns and name not in seen:
+            seen.add(name)
+            keep[col] = len(keep)
+    return keep
+
+
+def _rows(archive, path, strings, dates, durations, epoch):
+    """Yield ``(row number, {column: value})`` with values converted like pandas' openpyxl reader."""
+    with archive.open(path) as src:
+        parent = None
+        for event, node in iterparse(src, events=("start", "end")):
+            if event == "start":
+                if node.tag == MAIN + "sheetData":
+                    parent = node
+                continue
+            if node.tag != ROW:
+                continue
+            number = node.get("r")
+            cells, col = {}, 0
+            for cell in node.iter(CELL):
+                ref = cell.get("r")
+                col = column_index_from_string(ref.rstrip(DIGITS)) if ref else col + 1
+                kind = cell.get("t", "n")
+                if kind == "inlineStr":
+                    inline = cell.find(INLINE)
+                    if inline is not None and _text(inline):
+                        cells[col] = _text(inline)
+                    continue
+                raw = cell.findtext(VALUE)
+                if not raw:
+                    continue
+                if kind == "n":
+                    style = int(cell.get("s", 0))
+                    value = float(raw) if "." in raw or "E" in raw or "e" in raw else int(raw)
+                    if style in dates:
+                        try:
+                            value = from_excel(value, epoch, timedelta=style in durations)
+                        except (OverflowError, ValueError):
+                            value = np.nan
+                    elif isinstance(value, float) and value.is_integer():
+                        value = int(value)
+                elif kind == "s":
+                    value = strings[int(raw)]
+                elif kind == "str":
+                    value = raw
+                elif kind == "b":
+                    value = bool(int(raw))
+                elif kind == "d":
+                    value = from_ISO8601(raw)
+                else:
+                    # Error cells (#N/A, #REF!, ...)
+                    value = np.nan
+                if value != "":
+                    cells[col] = value
+            yield (int(number) if number else None), cells
+            # Drop parsed rows so the tree never holds more than one.
+            if parent is not None:
+                parent.clear()
+
+
+def read_xlsx(data, sheet_name=0, columns=None):
+    """DataFrame of one sheet, first row as header, like ``pd.read_excel(data, sheet_name)``.
+
+    With ``columns`` (a set of header names), only the first column under
+    each of those (stripped) headers is kept; if none of them is in the
+    header row, every column is.
+    """
+    with zipfile.ZipFile(data) as archive:
+        path, epoch = _sheet_path(archive, sheet_name)
+        strings = _shared_strings(archive, "xl/sharedStrings.xml")
+        dates, durations = _date_styles(archive, "xl/styles.xml")
+
+        grid, keep, last = [], None, 0
+        for number, cells in _rows(archive, path, strings, dates, durations, epoch):
+            number = number or len(grid) + 1
+            # Missing rows are blank rows.
+            grid.extend([] for _ in range(number - 1 - len(grid)))
+            if keep is None:
+                # Project only when the header is the first row, as pandas reads it.
+                keep = _wanted_columns(cells, columns) if columns and number == 1 else {}
+            if cells:
+                last = number
+            if keep:
+                row = [""] * len(keep)
+                for col, value in cells.items():
+                    if col in keep:
+                        row[keep[col]] = value
+            else:
+                row = [""] * max(cells, default=0)
+                for col, value in cells.items():
+                    row[col - 1] = value
+            grid.append(row)
+
+    # Trailing blank rows are dropped, short rows padded with "" (what pandas' reader does).
+    del grid[last:]
+    width = max(map(len, grid), default=0)
+    for row in grid:
+        row.extend([""] * (width - len(row)))
+    if not grid:
+        return pd.DataFrame()
+    return TextParser(grid, header=0, skip_blank_lines=False).read()
@@ -0,0 +1,4 @@
+# --- Portfolio overview inside the multipage app: same process, data store and caches ---
+from dashboard.views import portfolio_page
+
+portfolio_page()
@@ -0,0 +1,4 @@
+# --- PM view inside the multipage app: same process, data store and caches ---
+from dashboard.views import pm_page
+
+pm_page()
@@ -0,0 +1,4 @@
+# --- Project comparison inside the multipage app: same process, data store and caches ---
+from dashboard.views import compare_page
+
+compare_page()
@@ -1,492 +1,7 @@
-import streamlit as st
-import pandas as pd
-import re
-from pathlib import Path
-import base64
-
-
-
-# --- Page config ---
-st.set_page_config(page_title="Project Dashboard", layout="wide")
-
-
-# --- Floating Company Logo (screen + print: page 1 only) ---
-def get_base64_image(image_path):
-    with open(image_path, "rb") as img_file:
-        return base64.b64encode(img_file.read()).decode()
-
-logo_base64 = get_base64_image("logo.png")
-
-st.markdown(f"""
-    <style>
-    /* Screen: keep floating logo like before */
-    .fixed-logo {{
-        position: fixed;
-        top: 15px;
-        right: 25px;
-        z-index: 9999;
-    }}
-
-    /* Inline logo is hidden on screen */
-    .print-logo-inline {{ display: none; }}
-
-    /* Print rules */
-    @media print {{
-        /* Hide the floating (fixed) one while printing to avoid overlap */
-        .fixed-logo {{ display: none; }}
-
-        /* Show a single inline logo at the very top of page 1 only (flows with content) */
-        .print-logo-inline {{
-            display: block;
-            text-align: right;
-            margin: 10px 25px 10px 0; /* adjust if needed */
-
-
-        }}
-    }}
-    </style>
-
-    <!-- Screen (floating) -->
-    <div class="fixed-logo">
-        <img src="data:image/png;base64,{logo_base64}" width="100" alt="Company logo">
-    </div>
-
-    <!-- Print-only (appears once at start of document, i.e., on page 1) -->
-    <div class="print-logo-inline">
-        <img src="data:image/png;base64,{logo_base64}" width="100" alt="Company logo">
-    </div>
-    """, unsafe_allow_html=True)
-
-
-st.markdown("""
-    <style>
-    /* Use theme variables so it works in light & dark mode */
-    div[data-testid="stMetric"] {
-        border: 1px solid var(--secondary-background-color);
-        border-radius: 8px;
-        padding: 8px;
-        background-color: var(--background-color);
-        color: var(--text-color);
-    }
-
-    div[data-testid="column"] > div > div {
-        border: 1px solid var(--secondary-background-color);
-        border-radius: 8px;
-        padding: 8px;
-        margin-bottom: 8px;
-        background-color: var(--background-color);
-        color: var(--text-color);
-    }
-
-    div[data-testid="stMetric"], 
-    div[data-testid="column"] > div > div {
-        box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-    }
-    
-
-    @media print {
-    /* Force clean black & white for everything */
-    body, [class^="st-"], [data-testid] {
-        background: #ffffff !important;
-        color: #000000 !important;
-    }
-
-    /* Metrics (top row) */
-    div[data-testid="stMetric"] {
-        border: 1px solid #000000 !important;
-        border-radius: 4px;
-        padding: 6px;
-        background: #ffffff !important;
-        color: #000000 !important;
-    }
-
-    /* All content boxes inside columns */
-    div[data-testid="column"] > div > div {
-        border: 1px solid #000000 !important;
-        border-radius: 4px;
-        padding: 6px;
-        margin-bottom: 6px;
-        background: #ffffff !important;
-        color: #000000 !important;
-    }
-
-    /* Headings bold + clear */
-    h1, h2, h3, h4, h5, h6, strong {
-        color: #000000 !important;
-        font-weight: bold !important;
-    }
-
-    /* Remove shadows in print */
-    * {
-        box-shadow: none !important;
-    }
-
-    /* --- Logo print fix (always full on page 1) --- */
-    .print-logo-inline {
-        display: block !important;
-        text-align: right;
-        margin: 40px 25px 20px 0;  /* keep away from page edge */
-        page-break-after: avoid;   /* don’t push content to new page */
-    }
-    .print-logo-inline img {
-        width: 120px !important;   /* fixed safe width */
-        height: auto !important;   /* keep proportions */
-        max-width: none !important;
-        max-height: none !important;
-        object-fit: contain !important;
-    }
-
-
-}
-    
-
-
-    </style>
-""", unsafe_allow_html=True)
-
-
-
-# --- Load Excel and normalize headers
-# --- Load Excel directly from GitHub repo (raw link) ---
-url = "https://raw.githubusercontent.com/avdhootr3/bsdprojects/main/data/Dashboard_data.xlsx"
-df = pd.read_excel(url, sheet_name=0)
-df.columns = df.columns.str.strip()
-
-
-
-# ================================
-# 🔎 SIMPLE & STRUCTURED NAVIGATION
-# ================================
-
-st.sidebar.header("📂 Project Navigation")
-
-# Ensure clean headers
-df["Region"] = df["Region"].astype(str).str.strip()
-df["Type"] = df["Type"].astype(str).str.strip()
-df["Project"] = df["Project"].astype(str).str.strip()
-df["Project1"] = df["Project1"].astype(str).str.strip()
-
-# Unique projects count helper
-def unique_project_count(data):
-    return data["Project"].nunique()
-
-
-# -------------------------------
-# 1️⃣ Simple Project Dropdown
-# -------------------------------
-
-project_list = sorted(df["Project"].dropna().unique())
-
-if "selected_project" not in st.session_state:
-    st.session_state.selected_project = "-- Select Project --"
-
-selected_project = st.sidebar.selectbox(
-    "Select Project",
-    ["-- Select Project --"] + project_list,
-    key="selected_project"
-)
-
-# -------------------------------
-# 📍 Region Summary (Display Only)
-# -------------------------------
-
-st.sidebar.markdown("---")
-st.sidebar.subheader("📍 Region Summary")
-
-selected_project_value = st.session_state.selected_project
-
-selected_region = None
-selected_type = None
-
-if selected_project_value != "-- Select Project --":
-    row = df[df["Project"] == selected_project_value]
-    if not row.empty:
-        selected_region = row.iloc[0]["Region"]
-        selected_type = row.iloc[0]["Type"]
-
-regions = sorted(df["Region"].dropna().unique())
-
-for region in regions:
-    region_df = df[df["Region"] == region]
-    count = region_df["Project"].nunique()
-
-    if region == selected_region:
-        st.sidebar.markdown(
-            f"<div style='background-color:#ffe082; padding:6px; border-radius:6px; font-weight:bold;'>{region} ({count})</div>",
-            unsafe_allow_html=True
-        )
-    else:
-        st.sidebar.markdown(
-            f"<div style='padding:6px;'>{region} ({count})</div>",
-            unsafe_allow_html=True
-        )
-
-
-# -------------------------------
-# 📁 Type Summary (Display Only)
-# -------------------------------
-
-st.sidebar.markdown("---")
-st.sidebar.subheader("📁 Type Summary")
-
-types = sorted(df["Type"].dropna().unique())
-
-for t in types:
-    type_df = df[df["Type"] == t]
-    count = type_df["Project"].nunique()
-
-    if t == selected_type:
-        st.sidebar.markdown(
-            f"<div style='background-color:#c8e6c9; padding:6px; border-radius:6px; font-weight:bold;'>{t} ({count})</div>",
-            unsafe_allow_html=True
-        )
-    else:
-        st.sidebar.markdown(
-            f"<div style='padding:6px;'>{t} ({count})</div>",
-            unsafe_allow_html=True
-        )
-
-# ================================
-# 🎯 Final Project Selection
-# ================================
-
-if st.session_state.selected_project == "-- Select Project --":
-    st.info("Please select a project from sidebar.")
-    st.stop()
-
-project_df = df[df["Project"] == st.session_state.selected_project]
-
-if project_df.empty:
-    st.warning("Project not found.")
-    st.stop()
-
-project = project_df.iloc[0]
-# From here down, keep your *existing* rendering logic using 'project'
-
-
-
-# --- Helpers ---
-def get_field(row, candidates):
-    """Return first non-null value for any name in candidates list (handles header variants)."""
-    for name in candidates:
-        if name in row.index:
-            val = row.get(name)
-            if pd.notna(val):
-                return val
-    return None
-
-def format_num(value):
-    """Return integer string for numeric values (including 0). Blank for NaN."""
-    try:
-        num = pd.to_numeric(value, errors='coerce')
-        if pd.isna(num):
-            return ""
-        return str(int(round(num, 0)))
-    except Exception:
-        s = "" if value is None else str(value).strip()
-        return s
-
-def parse_percent(value):
-    """
-    Parse a value into integer percent (0-100). Accepts:
-      - 0.67  -> 67
-      - 67    -> 67
-      - "67%" -> 67
-      - " 0.67 " -> 67
-    Returns None for blank/NaN/unparseable.
-    """
-    if value is None:
-        return None
-    if pd.isna(value):
-        return None
-    s = str(value).strip()
-    if s == "":
-        return None
-    has_pct = "%" in s
-    s_clean = s.replace('%', '').replace(',', '').strip()
-    try:
-        num = float(s_clean)
-    except Exception:
-        return None
-    if has_pct:
-        pct = num
-    else:
-        if abs(num) <= 1:
-            pct = num * 100
-        else:
-            pct = num
-    pct = int(round(pct, 0))
-    pct = max(-100, min(100, pct))
-    return pct
-
-def color_percent_html(pct):
-    """Return HTML span with color for pct (green>0, red<0, black==0)."""
-    if pct is None:
-        return ""
-    color = "green" if pct > 0 else ("red" if pct < 0 else "black")
-    return f"<span style='color:{color}; font-weight:bold'>{pct}%</span>"
-
-def format_date(value):
-    """Format pandas/str/Excel date to DD-MMM-YYYY, safe for serials & text."""
-    try:
-        if value is None or (isinstance(value, float) and pd.isna(value)):
-            return ""
-        # handle Excel serial numbers directly
-        if isinstance(value, (int, float)):
-            parsed = pd.to_datetime(value, unit="d", origin="1899-12-30", errors="coerce")
-        else:
-            parsed = pd.to_datetime(value, errors="coerce", dayfirst=False)
-        if pd.isna(parsed):
-            return str(value)  # fallback: show raw value instead of 1970
-        return parsed.strftime("%d-%b-%Y")
-    except Exception:
-        return str(value)
-
-
-def break_sentences_to_html(text):
-    """Insert line breaks (<br>) after '|' for markdown with unsafe_html."""
-    if text is None or (isinstance(text, float) and pd.isna(text)):
-        return ""
-    s = str(text).strip()
-    s = re.sub(r'([|])\s+', r'\1\n', s)
-    return s.replace("\n", "<br>")
-
-
-proj_name = get_field(project, ['Project1'])   # use Project1 column
-proj_dates = get_field(project, ['Project Dates', 'Project Dates ', 'ProjectDate', 'Project_Date'])
-duration = get_field(project, ['Project Duration', 'ProjectDuration', 'Duration', 'Project Duration '])
-st.markdown(f"### 📌 Project : **{proj_name or ''}**")
-
-st.markdown(f"**📅 Project Dates**: {proj_dates or ''} &nbsp;&nbsp;&nbsp; **📆 Duration**: {duration or ''}")
-st.markdown("---")
-
-# --- First row (Dynamic layout based on Open AR)
-
-total_po = get_field(project, ['Total PO Amt', 'Total PO Amt ', 'Total_PO_Amt', ' Total PO Amt '])
-billed_till = get_field(project, ['Billed Till Date', 'Billed Till Date '])
-open_billing = get_field(project, ['Open Billing', 'Open Billing '])
-billed_raw = get_field(project, ['Billed', 'Billed ', 'Billed %', 'Billed%'])
-open_ar = get_field(project, ['Open AR', 'Open AR '])
-billing_milestone = get_field(project, ['Billing Milestone', 'Billing Milestone '])
-
-billed_pct = parse_percent(billed_raw)
-
-# --- Determine whether Open AR should be shown
-show_open_ar = False
-if open_ar not in [None, "", 0, "0"]:
-    try:
-        if float(open_ar) != 0:
-            show_open_ar = True
-    except:
-        pass
-
-# --- Create dynamic columns
-num_cols = 5 if show_open_ar else 4
-cols = st.columns(num_cols)
-
-# --- Column 1
-cols[0].metric("💰 PO Amt (in Lakhs)", f"₹ {format_num(total_po)}")
-
-# --- Column 2
-cols[1].metric("📤 Billing Done (in Lakhs)", f"₹ {format_num(billed_till)}")
-
-# --- Column 3
-cols[2].metric("🧾 Open Billing (in Lakhs)", f"₹ {format_num(open_billing)}")
-
-# --- Column 4
-if billed_pct is not None:
-    cols[3].metric("📊 Billed %", f"{billed_pct}%")
-    with cols[3]:
-        prog = max(0, min(100, billed_pct)) / 100.0
-        st.progress(prog)
-else:
-    cols[3].metric("📊 Billed %", "N/A")
-
-# --- Column 5 (Only if Open AR exists and non-zero)
-if show_open_ar:
-    cols[4].metric("💳 Open AR (in Lakhs)", f"₹ {format_num(open_ar)}")
-
-
-# --- Second row
-profit_ytd_raw = get_field(project, ['Profit_YTD MIS', 'Profit_YTD_MIS', 'Profit_YTD MIS'])
-profit_fy_raw  = get_field(project, ['Profit_FY24-25_MIS', 'Profit_FY24-25 MIS', 'Profit_FY24-25_MIS'])
-profit_ytd = parse_percent(profit_ytd_raw)
-profit_fy  = parse_percent(profit_fy_raw)
-
-# ✅ Modified: handle text or numeric for Resources Deployed
-resource_val = get_field(project, ['Resource', 'Resource Deployed', 'Resources', 'Resource '])
-if pd.notna(resource_val):
-    try:
-        # try numeric formatting
-        resource_val = str(int(float(resource_val)))
-    except Exception:
-        # keep as string if not numeric
-        resource_val = str(resource_val).strip()
-else:
-    resource_val = ""
-
-# ⬇ Milestone amount as TEXT (no numeric formatting)
-milestone_amt_str = get_field(project, ['Milestone billing amount', 'Milestone billing amount ', 'MilestoneBillingAmount'])
-milestone_amt_str = "" if milestone_amt_str is None else str(milestone_amt_str).strip()
-
-line_items = []
-if profit_ytd is not None and profit_ytd != 0:
-    line_items.append(("💹 Profit YTD MIS (%)", color_percent_html(profit_ytd), True))
-if profit_fy is not None and profit_fy != 0:
-    line_items.append(("📈 Profit FY24-25 MIS (%)", color_percent_html(profit_fy), True))
-
-line_items.append(("👥 Resources Deployed", resource_val, False))
-if milestone_amt_str != "":
-    line_items.append(("💵 Milestone Billing Amount", f"₹ {milestone_amt_str}", False))
-
-if len(line_items) == 0:
-    cols = st.columns(1)
-else:
-    cols = st.columns(len(line_items))
-
-for i, (label, val, is_html) in enumerate(line_items):
-    target_col = cols[i]
-    if is_html:
-        target_col.markdown(f"**{label}**: {val}", unsafe_allow_html=True)
-    else:
-        target_col.markdown(f"**{label}**: {val}")
-
-# --- Billing Milestone (Full width for multi-line text) ---
-if billing_milestone:
-    st.markdown("###### 📅 Billing Milestone")
-    st.markdown(break_sentences_to_html(billing_milestone), unsafe_allow_html=True)
-
-
-
-# --- Scope / Overall Progress
-col1, col2 = st.columns(2)
-col1.markdown("### 🔧 Scope")
-scope_val = get_field(project, ['Scope', 'Scope ', 'ScopeDetails'])
-col1.markdown(break_sentences_to_html(scope_val), unsafe_allow_html=True)
-
-col2.markdown("### 📈 Overall Progress")
-overall_val = get_field(project, ['Overall Progress', 'OverallProgress', 'Overall Progress '])
-col2.markdown(break_sentences_to_html(overall_val), unsafe_allow_html=True)
-
-# --- Tech / Weekly Plan
-col1, col2 = st.columns(2)
-col1.markdown("### 🛠️ Technology / Tools")
-tech_val = get_field(project, ['Technology / tools', 'Technology / tools ', 'Technology', 'Technology / Tools'])
-col1.markdown(break_sentences_to_html(tech_val), unsafe_allow_html=True)
-
-col2.markdown("### 📅 Weekly Plan")
-weekly_val = get_field(project, ['Weekly Plan', 'WeeklyPlan', 'Weekly Plan '])
-col2.markdown(break_sentences_to_html(weekly_val), unsafe_allow_html=True)
-
-# --- Footer
-updated_on = get_field(project, ['Update Date', 'Updated On', 'Update', 'UpdateDate'])
-st.markdown("---")
-st.caption("Updated on: " + format_date(updated_on))
-
-
-
-
-
-
-
+# --- Project Dashboard (full view) ---
+# The page lives in dashboard.views, on the data store and renderer it shares
+# with the PM view; the Portfolio Overview, PM View and Compare Projects
+# pages are under pages/.
+from dashboard.views import dashboard_page
 
+dashboard_page()
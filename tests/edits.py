@@ -0,0 +1,28 @@
+"""Random changes to a project frame, for checking incremental rebuilds against full ones."""
+import pandas as pd
+
+
+def random_edit(df, rng, values):
+    """One random edit, add, removal, reorder or duplication of project rows.
+
+    Edits set a cell of one of the ``values`` columns to one of its listed values.
+    """
+    pos = rng.randrange(len(df))
+    kind = rng.choice(["edit", "edit", "add", "remove", "reorder", "duplicate"])
+    if kind == "edit":
+        col = rng.choice(list(values))
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            df = df.astype({col: object})
+        df.iat[pos, df.columns.get_loc(col)] = rng.choice(values[col])
+    elif kind == "add":
+        row = df.iloc[[pos]].assign(Project=f"NEW{rng.randrange(10**6)}", Scope="new payment")
+        df = pd.concat([df, row], ignore_index=True)
+    elif kind == "remove":
+        df = df.drop(index=pos).reset_index(drop=True)
+    elif kind == "reorder":
+        df = df.sample(frac=1, random_state=rng.randrange(10**6)).reset_index(drop=True)
+    else:
+        # A second row for the project, differing from the first so the first-row rule matters.
+        row = df.iloc[[pos]].assign(Scope="payment payment", **{"Total PO Amt": rng.uniform(1, 5000)})
+        df = pd.concat([row, df] if rng.random() < 0.5 else [df, row], ignore_index=True)
+    return df
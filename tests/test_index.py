@@ -0,0 +1,37 @@
+"""The project index diffed from the previous version equals one built from scratch."""
+import random
+
+import pytest
+
+from benchmarks.synthetic import synthetic_frame
+from dashboard.compact import compact
+from dashboard.index import ProjectIndex, project_index
+from dashboard.loader import CachedWorkbook
+from dashboard.workbook import clean_frame
+from tests.edits import random_edit
+
+EDITS = {
+    "Project": ["PRJ000001", "RENAMED", None],
+    "Region": ["North", "Atlantis", None],
+    "Type": ["Smart City", "Research", None],
+    "Scope": ["payment pending", None],
+}
+STEPS = 200
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_incremental_matches_full_rebuild(seed):
+    rng = random.Random(seed)
+    raw = clean_frame(synthetic_frame(40, text_length=80, seed=seed))
+    previous = CachedWorkbook(compact(raw), "v0")
+    project_index(previous)
+    for step in range(STEPS):
+        raw = random_edit(raw, rng, EDITS)
+        entry = CachedWorkbook(compact(raw), f"v{step + 1}", version=step + 2)
+        incremental, full = project_index(entry, previous), ProjectIndex(entry.df)
+        assert incremental.df is entry.df
+        assert incremental.positions == full.positions, step
+        assert incremental.projects == full.projects, step
+        assert incremental.region_counts == full.region_counts, step
+        assert incremental.type_counts == full.type_counts, step
+        previous = entry
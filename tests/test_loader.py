@@ -0,0 +1,27 @@
+"""Multi-part loads survive a parse worker dying."""
+import os
+import signal
+
+from benchmarks.synthetic import write_workbook
+from dashboard import loader
+
+
+def test_load_recovers_from_a_killed_parse_worker(tmp_path):
+    loader.clear_cache()
+    write_workbook(tmp_path / "a.xlsx", 5, seed=1)
+    write_workbook(tmp_path / "b.xlsx", 5, seed=2)
+    assert len(loader.load_workbook(str(tmp_path), ttl=0)) == 10
+
+    pool = loader._pool
+    for process in list(pool._processes.values()):
+        os.kill(process.pid, signal.SIGKILL)
+        process.join()
+    # Both parts change, so the refresh goes through the pool.
+    for name, rows in [("a.xlsx", 6), ("b.xlsx", 7)]:
+        write_workbook(tmp_path / name, rows, seed=rows)
+        os.utime(tmp_path / name, (0, 0))
+
+    df = loader.load_workbook(str(tmp_path), ttl=0)
+    assert len(df) == 13
+    assert set(df["Source"]) == {"a.xlsx", "b.xlsx"}
+    assert loader._pool is not pool
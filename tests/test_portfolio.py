@@ -0,0 +1,40 @@
+"""The portfolio summary diffed from the previous version equals one built from scratch."""
+import random
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import synthetic_frame
+from dashboard.compact import compact
+from dashboard.loader import CachedWorkbook
+from dashboard.portfolio import PortfolioSummary, portfolio_summary
+from dashboard.workbook import clean_frame
+from tests.edits import random_edit
+
+EDITS = {
+    "Project": ["PRJ000001", "RENAMED", None],
+    "Region": ["North", "Atlantis", None],
+    "Type": ["Smart City", "Research", None],
+    "Billed": [0, 55, 100, pd.NA],
+    "Total PO Amt": [0.0, 1250.5, float("nan")],
+    "Open AR": [0.0, 310.25, float("nan")],
+    "Scope": ["payment pending", None],
+}
+STEPS = 200
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_incremental_matches_full_rebuild(seed):
+    rng = random.Random(seed)
+    raw = clean_frame(synthetic_frame(40, text_length=80, seed=seed))
+    previous = CachedWorkbook(compact(raw), "v0")
+    portfolio_summary(previous)
+    for step in range(STEPS):
+        raw = random_edit(raw, rng, EDITS)
+        entry = CachedWorkbook(compact(raw), f"v{step + 1}", version=step + 2)
+        incremental, full = portfolio_summary(entry, previous), PortfolioSummary(entry.df)
+        # Sums carried across versions may differ from fresh ones in the last bits.
+        pd.testing.assert_frame_equal(incremental.by_region, full.by_region, check_exact=False, obj=f"step {step}")
+        pd.testing.assert_frame_equal(incremental.by_type, full.by_type, check_exact=False, obj=f"step {step}")
+        pd.testing.assert_series_equal(incremental.totals, full.totals, check_exact=False, obj=f"step {step}")
+        previous = entry
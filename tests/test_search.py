@@ -0,0 +1,44 @@
+"""The search index diffed from the previous version equals one built from scratch."""
+import random
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import synthetic_frame
+from dashboard.compact import compact
+from dashboard.loader import CachedWorkbook
+from dashboard.search import SearchIndex, search_index
+from dashboard.workbook import clean_frame
+from tests.edits import random_edit
+
+QUERIES = ["payment", "migration pending", "billing", "audit", "new"]
+EDITS = {col: ["payment pending", "new audit | billing", None]
+         for col in ["Scope", "Overall Progress", "Challenges / Risks"]}
+STEPS = 200
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_incremental_matches_full_rebuild(seed):
+    rng = random.Random(seed)
+    raw = clean_frame(synthetic_frame(40, text_length=80, seed=seed))
+    previous = CachedWorkbook(compact(raw), "v0")
+    search_index(previous)
+    for step in range(STEPS):
+        raw = random_edit(raw, rng, EDITS)
+        entry = CachedWorkbook(compact(raw), f"v{step + 1}", version=step + 2)
+        incremental, full = search_index(entry, previous), SearchIndex(entry.df)
+        assert incremental.projects == full.projects
+        assert incremental.postings == full.postings
+        assert incremental.vocabulary == full.vocabulary
+        for query in QUERIES:
+            assert incremental.search(query) == full.search(query), (step, query)
+        previous = entry
+
+
+def test_snippet_escapes_around_matches():
+    df = pd.DataFrame({"Project": ["P1"], "Scope": ['R&D "a" <b>and</b> api'],
+                       "Overall Progress": [None], "Weekly Plan": [None], "Challenges / Risks": [None]})
+    ((project, _, snippet),) = SearchIndex(df).search("a")
+    assert project == "P1"
+    assert snippet == ("<i>Scope</i>: R&amp;D &quot;<mark>a</mark>&quot; &lt;b&gt;<mark>and</mark>&lt;/b&gt; "
+                       "<mark>api</mark>")